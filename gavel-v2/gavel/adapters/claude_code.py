@@ -579,10 +579,11 @@ def _read_hook_input() -> dict[str, Any]:
         }
     """
     try:
-        raw = sys.stdin.read()
+        # json.loads accepts bytes directly; skip the text-mode decode.
+        raw = sys.stdin.buffer.read()
         if raw.strip():
             return json.loads(raw)
-    except (json.JSONDecodeError, OSError):
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         pass
     return {}
 
@@ -609,6 +610,15 @@ def main() -> None:
         sys.exit(1)
 
     command = sys.argv[1].lower().strip()
+    if command not in ("pre_tool_use", "post_tool_use"):
+        # Reject before touching stdin or the session cache.
+        print(json.dumps({
+            "status": "error",
+            "reason": f"Unknown command: {command}. "
+                      "Use 'pre_tool_use' or 'post_tool_use'.",
+        }))
+        return
+
     hook = ClaudeCodeHook()
     hook_input = _read_hook_input()
 
@@ -617,15 +627,9 @@ def main() -> None:
 
     if command == "pre_tool_use":
         result = hook.pre_tool_use(tool_name, tool_input)
-    elif command == "post_tool_use":
+    else:
         tool_output = hook_input.get("tool_output")
         result = hook.post_tool_use(tool_name, tool_input, tool_output)
-    else:
-        result = {
-            "status": "error",
-            "reason": f"Unknown command: {command}. "
-                      "Use 'pre_tool_use' or 'post_tool_use'.",
-        }
 
     print(json.dumps(result))
 
@@ -25,6 +25,18 @@ from gavel.chain import GovernanceChain, ChainStatus
 from gavel.evidence import ReviewResult
 
 
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, default=str)
+
+
+def _sha256_canonical(data: Any) -> str:
+    """SHA-256 of ``json.dumps(data, sort_keys=True, default=str)``.
+
+    One-shot ``encode()`` runs in the C encoder; ``iterencode()`` falls
+    back to the pure-Python generator and is 2-3x slower on large chains.
+    """
+    return hashlib.sha256(_CANONICAL_JSON.encode(data).encode()).hexdigest()
+
+
 # ═══════════════════════════════════════════════════════════════
 # Schema models
 # ═══════════════════════════════════════════════════════════════
@@ -87,8 +99,7 @@ class GovernanceArtifact(BaseModel):
         """SHA-256 of the artifact content (excluding artifact_hash itself)."""
         data = self.model_dump(mode="json")
         data.pop("artifact_hash", None)
-        content = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _sha256_canonical(data)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -292,8 +303,7 @@ def verify_artifact(artifact_dict: dict[str, Any]) -> dict[str, Any]:
     stored_hash = artifact_dict.get("artifact_hash", "")
     data_copy = dict(artifact_dict)
     data_copy.pop("artifact_hash", None)
-    content = json.dumps(data_copy, sort_keys=True, default=str)
-    computed_hash = hashlib.sha256(content.encode()).hexdigest()
+    computed_hash = _sha256_canonical(data_copy)
     if stored_hash and stored_hash != computed_hash:
         errors.append(
             f"artifact_hash mismatch: expected {computed_hash[:16]}..., "
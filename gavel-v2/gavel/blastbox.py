@@ -18,9 +18,13 @@ import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 
+# Built once; same bytes as json.dumps(obj, sort_keys=True). See chain.py.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScopeDeclaration:
     """What the proposed action is allowed to touch."""
 
@@ -32,11 +36,15 @@ class ScopeDeclaration:
     max_cpu: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidencePacket:
     """
     The output of a Blast Box execution. Every field is hashed.
     This packet is what reviewers examine — not the action itself.
+
+    Slotted: one is built per blast-box run and per evidence-repo read, so
+    skipping the per-instance ``__dict__`` keeps construction and attribute
+    access cheap.
     """
 
     packet_id: str = field(default_factory=lambda: f"ep-{uuid.uuid4().hex[:8]}")
@@ -71,7 +79,7 @@ class EvidencePacket:
     finished_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def compute_hash(self) -> str:
-        content = json.dumps(
+        content = _CANONICAL_JSON.encode(
             {
                 "packet_id": self.packet_id,
                 "chain_id": self.chain_id,
@@ -86,8 +94,7 @@ class EvidencePacket:
                 "image": self.image,
                 "image_digest": self.image_digest,
                 "network_mode": self.network_mode,
-            },
-            sort_keys=True,
+            }
         )
         return hashlib.sha256(content.encode()).hexdigest()
 
@@ -172,16 +179,17 @@ class BlastBox:
         Returns list of violations (empty = compliant).
         """
         violations = []
+        allow_prefixes = tuple(declared_scope.allow_paths)
 
-        for f in packet.files_modified + packet.files_created:
-            if not any(f.startswith(p) for p in declared_scope.allow_paths):
+        for f in chain(packet.files_modified, packet.files_created):
+            if not f.startswith(allow_prefixes):
                 violations.append(f"File '{f}' outside declared allow_paths")
 
         if not declared_scope.allow_network and packet.network_mode != "none":
             violations.append("Network access detected but not declared in scope")
 
         for f in packet.files_deleted:
-            if not any(f.startswith(p) for p in declared_scope.allow_paths):
+            if not f.startswith(allow_prefixes):
                 violations.append(f"Deleted file '{f}' outside declared allow_paths")
 
         return violations
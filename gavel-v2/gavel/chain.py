@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-import uuid
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -23,6 +23,13 @@ from pydantic import BaseModel, Field
 
 from gavel.request_id import get_request_id
 
+# Canonical encoder for hash input. Byte-identical to
+# ``json.dumps(obj, sort_keys=True)`` but built once: ``json.dumps`` with
+# non-default kwargs constructs a fresh JSONEncoder on every call. The
+# byte format is part of the tamper seal, so it must never change
+# (which rules out compact encoders such as orjson).
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True)
+
 
 class EventType(str, Enum):
     INBOUND_INTENT = "INBOUND_INTENT"
@@ -44,7 +51,7 @@ class EventType(str, Enum):
 class ChainEvent(BaseModel):
     """A single event in a governance chain. Immutable once created."""
 
-    event_id: str = Field(default_factory=lambda: f"evt-{uuid.uuid4().hex[:8]}")
+    event_id: str = Field(default_factory=lambda: f"evt-{secrets.token_hex(4)}")
     chain_id: str
     event_type: EventType
     actor_id: str
@@ -57,7 +64,7 @@ class ChainEvent(BaseModel):
 
     def compute_hash(self) -> str:
         """SHA-256 hash of the event content + previous hash."""
-        content = json.dumps(
+        content = _CANONICAL_JSON.encode(
             {
                 "event_id": self.event_id,
                 "chain_id": self.chain_id,
@@ -67,8 +74,7 @@ class ChainEvent(BaseModel):
                 "timestamp": self.timestamp.isoformat(),
                 "payload": self.payload,
                 "prev_hash": self.prev_hash,
-            },
-            sort_keys=True,
+            }
         )
         return hashlib.sha256(content.encode()).hexdigest()
 
@@ -96,7 +102,7 @@ class GovernanceChain:
     """
 
     def __init__(self, chain_id: str | None = None):
-        self.chain_id = chain_id or f"c-{uuid.uuid4().hex[:8]}"
+        self.chain_id = chain_id or f"c-{secrets.token_hex(4)}"
         self.events: list[ChainEvent] = []
         self.status = ChainStatus.PENDING
         self.created_at = datetime.now(timezone.utc)
@@ -209,7 +215,7 @@ class GovernanceChain:
                 )
 
             # Recompute event hash
-            content = json.dumps(
+            content = _CANONICAL_JSON.encode(
                 {
                     "event_id": event["event_id"],
                     "chain_id": artifact["chain_id"],
@@ -219,8 +225,7 @@ class GovernanceChain:
                     "timestamp": event["timestamp"],
                     "payload": event["payload"],
                     "prev_hash": event["prev_hash"],
-                },
-                sort_keys=True,
+                }
             )
             computed = hashlib.sha256(content.encode()).hexdigest()
 
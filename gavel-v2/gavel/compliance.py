@@ -115,21 +115,22 @@ class IncidentClassifier:
     @classmethod
     def classify(cls, event_type: str, payload: dict[str, Any] = None) -> IncidentSeverity:
         """Classify an event into an incident severity level."""
-        payload = payload or {}
         event_lower = event_type.lower()
-        payload_text = str(payload).lower()
-        combined = f"{event_lower} {payload_text}"
+        # Patterns are single tokens, so searching the two texts separately
+        # matches exactly what searching "event payload" would; an empty
+        # payload contributes nothing and is never rendered.
+        payload_text = str(payload).lower() if payload else ""
 
         for pattern in cls.CRITICAL_PATTERNS:
-            if pattern in combined:
+            if pattern in event_lower or pattern in payload_text:
                 return IncidentSeverity.CRITICAL
 
         for pattern in cls.SERIOUS_PATTERNS:
-            if pattern in combined:
+            if pattern in event_lower or pattern in payload_text:
                 return IncidentSeverity.SERIOUS
 
         for pattern in cls.STANDARD_PATTERNS:
-            if pattern in combined:
+            if pattern in event_lower or pattern in payload_text:
                 return IncidentSeverity.STANDARD
 
         return IncidentSeverity.MINOR
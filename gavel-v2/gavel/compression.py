@@ -0,0 +1,33 @@
+"""Response compression that leaves Server-Sent Event streams alone."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StreamSafeGZipMiddleware:
+    """GZip responses, except on the paths listed in ``stream_paths``.
+
+    Older Starlette releases compress ``text/event-stream`` like any other
+    body, buffering events until the compressor flushes. Routing SSE paths
+    around the compressor keeps live events flowing regardless of version.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        stream_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.stream_paths = frozenset(stream_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.stream_paths:
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
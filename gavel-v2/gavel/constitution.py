@@ -28,7 +28,7 @@ class InvariantClass(str, Enum):
     PROHIBITED = "V"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Invariant:
     """A single constitutional invariant. Immutable by design."""
 
@@ -11,12 +11,32 @@ mandatory — there is no dict fallback. An engine is always available.
 
 SQLAlchemy's async engine is cached via ``functools.lru_cache``. Tests
 that need a fresh engine should call :func:`reset_engine`.
+
+Postgres connections are pooled by SQLAlchemy's ``AsyncAdaptedQueuePool``
+so each request checks out a warm connection instead of paying the
+TCP + TLS + auth handshake. Pool sizing is read from
+``GAVEL_DB_POOL_SIZE`` / ``GAVEL_DB_MAX_OVERFLOW`` so operators can size
+it against the number of gateway workers sharing one Postgres.
+
+asyncpg sends every statement as a named server-side prepared statement
+and keeps a per-connection LRU of them, so hot repository queries skip
+parse/plan after the first call on a pooled connection. The cache size
+is tunable with ``GAVEL_DB_STATEMENT_CACHE_SIZE`` and
+``GAVEL_DB_PLAN_CACHE_MODE`` pins Postgres' ``plan_cache_mode`` (e.g.
+``force_custom_plan``) for queries whose generic plan goes bad.
+
+Behind PgBouncer in transaction pooling mode (``GAVEL_DB_PGBOUNCER=1``)
+consecutive statements may land on different backends, so named
+prepared statements cannot be cached: both statement caches are turned
+off and each prepare gets a unique name. ``plan_cache_mode`` is not sent
+because PgBouncer rejects unknown startup parameters.
 """
 
 from __future__ import annotations
 
 import os
 import sys
+import uuid
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import AsyncIterator
@@ -31,6 +51,10 @@ from sqlalchemy.ext.asyncio import (
 
 _DEFAULT_TEST_URL = "sqlite+aiosqlite:///:memory:"
 _DEFAULT_DEV_URL = "sqlite+aiosqlite:///./gavel.db"
+_DEFAULT_POOL_SIZE = 20
+_DEFAULT_MAX_OVERFLOW = 5
+_DEFAULT_STATEMENT_CACHE_SIZE = 100
+_PLAN_CACHE_MODES = frozenset({"auto", "force_custom_plan", "force_generic_plan"})
 
 
 def _running_under_pytest() -> bool:
@@ -56,6 +80,52 @@ def _apply_production_tls(url: str) -> str:
     return f"{url}{sep}sslmode=require"
 
 
+def _int_env(name: str, default: int) -> int:
+    """Read a non-negative integer from *name*, falling back to *default*."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+    if value < 0:
+        raise ValueError(f"{name} must be >= 0, got {value}")
+    return value
+
+
+def _pgbouncer_enabled() -> bool:
+    return os.environ.get("GAVEL_DB_PGBOUNCER", "").strip().lower() in ("1", "true", "yes")
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def _asyncpg_connect_args() -> dict:
+    """Build asyncpg ``connect_args`` for prepared-statement caching."""
+    if _pgbouncer_enabled():
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    connect_args: dict = {
+        "prepared_statement_cache_size": _int_env(
+            "GAVEL_DB_STATEMENT_CACHE_SIZE", _DEFAULT_STATEMENT_CACHE_SIZE
+        ),
+    }
+    plan_cache_mode = os.environ.get("GAVEL_DB_PLAN_CACHE_MODE", "").strip()
+    if plan_cache_mode:
+        if plan_cache_mode not in _PLAN_CACHE_MODES:
+            raise ValueError(
+                f"GAVEL_DB_PLAN_CACHE_MODE must be one of "
+                f"{sorted(_PLAN_CACHE_MODES)}, got {plan_cache_mode!r}"
+            )
+        connect_args["server_settings"] = {"plan_cache_mode": plan_cache_mode}
+    return connect_args
+
+
 def resolve_database_url() -> str:
     """Resolve the database URL per Wave 1 precedence rules.
 
@@ -75,7 +145,12 @@ def get_engine() -> AsyncEngine:
     url = resolve_database_url()
     kwargs: dict = {"future": True}
     if url.startswith("postgresql+asyncpg://"):
-        kwargs.update(pool_size=20, max_overflow=5, pool_pre_ping=True)
+        kwargs.update(
+            pool_size=_int_env("GAVEL_DB_POOL_SIZE", _DEFAULT_POOL_SIZE),
+            max_overflow=_int_env("GAVEL_DB_MAX_OVERFLOW", _DEFAULT_MAX_OVERFLOW),
+            pool_pre_ping=True,
+            connect_args=_asyncpg_connect_args(),
+        )
     engine = create_async_engine(url, **kwargs)
     from gavel.db.observability import install_slow_query_logging
 
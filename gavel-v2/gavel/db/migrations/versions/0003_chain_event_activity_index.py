@@ -0,0 +1,36 @@
+"""Index chain_events on (chain_id, timestamp).
+
+Revision ID: 0003_chain_event_activity_index
+Revises: 0002_enrollment_records
+Create Date: 2026-10-15
+
+``ChainRepository.list_stale`` runs the heaviest query in the stale-chain
+sweep: a ``max(timestamp) GROUP BY chain_id`` subquery outer-joined to
+``governance_chains``. Without a matching index Postgres scans and sorts
+all of ``chain_events`` on every sweep; with ``(chain_id, timestamp)`` the
+aggregate is served from the index in key order.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_chain_event_activity_index"
+down_revision: Union[str, None] = "0002_enrollment_records"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_chain_events_chain_id_timestamp",
+        "chain_events",
+        ["chain_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chain_events_chain_id_timestamp", table_name="chain_events")
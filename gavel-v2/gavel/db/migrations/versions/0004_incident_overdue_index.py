@@ -0,0 +1,45 @@
+"""Partial index on incidents(deadline) for unreported incidents.
+
+Revision ID: 0004_incident_overdue_index
+Revises: 0003_chain_event_activity_index
+Create Date: 2026-10-15
+
+``IncidentRepository.list_overdue`` filters on ``deadline < now AND
+reported_at IS NULL``. Reported incidents accumulate forever while the
+unreported set stays small, so the index is partial on the same
+``reported_at IS NULL`` predicate the query uses: the planner can match it
+and range-scan ``deadline`` over only the rows that can still be overdue.
+
+On a large production table, create the index by hand with
+``CREATE INDEX CONCURRENTLY`` before running this revision's upgrade to
+avoid holding a write lock; ``if_not_exists`` makes the upgrade a no-op
+in that case.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_incident_overdue_index"
+down_revision: Union[str, None] = "0003_chain_event_activity_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_incidents_unreported_deadline",
+        "incidents",
+        ["deadline"],
+        if_not_exists=True,
+        postgresql_where=sa.text("reported_at IS NULL"),
+        sqlite_where=sa.text("reported_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_incidents_unreported_deadline", table_name="incidents")
@@ -0,0 +1,42 @@
+"""Index the status / expiry columns the background sweeps filter on.
+
+Revision ID: 0005_sweep_filter_indexes
+Revises: 0004_incident_overdue_index
+Create Date: 2026-10-15
+
+Every periodic sweep filters a table that only grows:
+
+* ``ChainRepository.list_stale(statuses=...)`` — the chain GC keeps only
+  terminal chains (``governance_chains.status``).
+* ``AgentRepository.count_active`` — ``/status`` counts
+  ``agents.status = 'ACTIVE'``.
+* ``GovernanceTokenRepository.list_expired`` / ``delete_expired`` — token
+  cleanup on ``enrollment_tokens.expires_at <= now``.
+
+Without an index each is a sequential scan per sweep; with one the cost
+tracks the number of matching rows instead of the table size.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_sweep_filter_indexes"
+down_revision: Union[str, None] = "0004_incident_overdue_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_governance_chains_status", "governance_chains", ["status"])
+    op.create_index("ix_agents_status", "agents", ["status"])
+    op.create_index("ix_enrollment_tokens_expires_at", "enrollment_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_enrollment_tokens_expires_at", table_name="enrollment_tokens")
+    op.drop_index("ix_agents_status", table_name="agents")
+    op.drop_index("ix_governance_chains_status", table_name="governance_chains")
@@ -38,9 +38,11 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -59,7 +61,7 @@ class GovernanceChainRow(Base):
     __tablename__ = "governance_chains"
 
     chain_id: Mapped[str] = mapped_column(String, primary_key=True)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="PENDING")
+    status: Mapped[str] = mapped_column(String, nullable=False, default="PENDING", index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     # Flat roster cache: {actor_id: [role, ...]}. Stored here because the
     # in-memory GovernanceChain tracks it alongside events.
@@ -86,9 +88,16 @@ class ChainEventRow(Base):
     ``request_id`` is stored for observability only — it is *not* part of
     the tamper seal (``event_hash`` is computed without it, matching the
     existing Pydantic model behavior).
+
+    ``(chain_id, timestamp)`` is indexed so the per-chain
+    ``max(timestamp)`` aggregate in ``ChainRepository.list_stale`` is
+    answered from the index instead of a full table scan + sort.
     """
 
     __tablename__ = "chain_events"
+    __table_args__ = (
+        Index("ix_chain_events_chain_id_timestamp", "chain_id", "timestamp"),
+    )
 
     chain_id: Mapped[str] = mapped_column(
         String, ForeignKey("governance_chains.chain_id"), primary_key=True
@@ -124,7 +133,7 @@ class AgentRecordRow(Base):
     trust_score: Mapped[int] = mapped_column(Integer, nullable=False, default=500)
     autonomy_tier: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     capabilities: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="ACTIVE")
+    status: Mapped[str] = mapped_column(String, nullable=False, default="ACTIVE", index=True)
     registered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     last_heartbeat: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     heartbeat_interval_s: Mapped[int] = mapped_column(Integer, nullable=False, default=30)
@@ -152,7 +161,7 @@ class EnrollmentTokenRow(Base):
     agent_did: Mapped[str] = mapped_column(String, nullable=False, index=True)
     agent_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     ttl_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=3600)
     revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     scope: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
@@ -184,9 +193,23 @@ class EnrollmentRecordRow(Base):
 
 
 class IncidentRow(Base):
-    """Mirror of :class:`gavel.compliance.IncidentReport`."""
+    """Mirror of :class:`gavel.compliance.IncidentReport`.
+
+    ``ix_incidents_unreported_deadline`` is a partial index on ``deadline``
+    restricted to ``reported_at IS NULL`` — the exact predicate of
+    ``IncidentRepository.list_overdue`` — so the overdue sweep touches only
+    unreported incidents instead of scanning the whole table.
+    """
 
     __tablename__ = "incidents"
+    __table_args__ = (
+        Index(
+            "ix_incidents_unreported_deadline",
+            "deadline",
+            postgresql_where=text("reported_at IS NULL"),
+            sqlite_where=text("reported_at IS NULL"),
+        ),
+    )
 
     incident_id: Mapped[str] = mapped_column(String, primary_key=True)
     agent_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
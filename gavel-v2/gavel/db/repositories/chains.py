@@ -16,57 +16,132 @@ Design decisions (Wave 2A):
 * ``save()`` is idempotent: the chain row is upserted, and new events
   are detected by ``sequence`` (rows already in the DB with a given
   ``(chain_id, sequence)`` are left alone — event rows are immutable
-  once written, since the hash seals them).
+  once written, since the hash seals them). The chain row and the
+  highest persisted sequence come back from a single query; events are
+  append-only, so everything past that sequence is new.
 * ``append_event()`` is the hot-path single-row insert used by routers
   holding a chain lock. It does not touch the chain-level row.
+  ``append_events()`` is its batched form: N events go out as one
+  multi-row ``INSERT`` (SQLAlchemy "insertmanyvalues") instead of N
+  round trips, and ``save()`` uses the same path for new events.
+* Events are immutable once written, so ``get()`` keeps a bounded LRU of
+  rehydrated events per chain (one cache per sessionmaker, shared by the
+  per-request repository instances). A warm ``get()`` only fetches rows
+  from the last cached sequence onward; that boundary row's
+  ``event_hash`` must match the cached copy, otherwise the cache entry
+  is dropped and the chain is reloaded in full. That boundary check only
+  proves the cache belongs to the same chain, not that earlier rows are
+  unmodified, so callers that verify integrity pass ``use_cache=False``
+  and get every event from the database. Chain-level fields are
+  always read fresh. ``list_all()`` never uses the cache. Cached
+  :class:`ChainEvent` objects are shared between callers and must be
+  treated as read-only, which the hash seal already demands.
 * ``list_stale()`` uses the latest event timestamp when events exist,
   falling back to ``created_at`` for empty chains. Filter is
   ``< cutoff`` to match :func:`gavel.gateway.cleanup_stale_chains`.
+  An optional ``statuses`` filter is applied in the same query, so the
+  GC sweep gets only deletable chains without rehydrating each one.
 """
 
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import delete as sa_delete
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import selectinload
 
 from gavel.chain import ChainEvent, ChainStatus, EventType, GovernanceChain
 from gavel.db.models import ChainEventRow, GovernanceChainRow
 
 
+_EVENT_CACHE_MAX_CHAINS = 1024
+
+_EventCache = OrderedDict[str, tuple[ChainEvent, ...]]
+_EVENT_CACHES: "weakref.WeakKeyDictionary[async_sessionmaker, _EventCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_EVENT_CACHES_LOCK = threading.Lock()
+
+
+def _event_cache_for(sessionmaker: async_sessionmaker) -> _EventCache:
+    with _EVENT_CACHES_LOCK:
+        cache = _EVENT_CACHES.get(sessionmaker)
+        if cache is None:
+            cache = OrderedDict()
+            _EVENT_CACHES[sessionmaker] = cache
+        return cache
+
+
 class ChainRepository:
     """Async repository for governance chains + events."""
 
     def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]):
         self._sessionmaker = sessionmaker
+        self._event_cache = _event_cache_for(sessionmaker)
 
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
 
-    async def get(self, chain_id: str) -> Optional[GovernanceChain]:
+    async def get(
+        self, chain_id: str, *, use_cache: bool = True
+    ) -> Optional[GovernanceChain]:
         """Load a chain by id, reconstructing the in-memory object.
 
         Returns ``None`` if the chain is not found (matches ``dict.get``
-        semantics used at the call sites). Events are eager-loaded via
-        ``selectinload`` in a single round-trip.
+        semantics used at the call sites). Previously loaded events come
+        from the per-sessionmaker cache; only newer rows are fetched.
+        Pass ``use_cache=False`` when the result feeds an integrity check,
+        so tampering with stored rows cannot hide behind the cache.
         """
+        cached = self._event_cache.get(chain_id, ()) if use_cache else ()
         async with self._sessionmaker() as session:
-            stmt = (
-                select(GovernanceChainRow)
-                .options(selectinload(GovernanceChainRow.events))
-                .where(GovernanceChainRow.chain_id == chain_id)
-            )
-            row = (await session.execute(stmt)).scalar_one_or_none()
+            row = await session.get(GovernanceChainRow, chain_id)
             if row is None:
+                self._event_cache.pop(chain_id, None)
                 return None
-            ev_rows = list(row.events)
-
-        return _row_to_chain(row, ev_rows)
+            # Re-read the last cached row too, to prove the prefix is
+            # still the one in the database.
+            start = max(len(cached) - 1, 0)
+            ev_rows = await self._load_event_rows(session, chain_id, start)
+            if cached and (
+                not ev_rows
+                or ev_rows[0].sequence != start
+                or ev_rows[0].event_hash != cached[-1].event_hash
+            ):
+                cached = ()
+                ev_rows = await self._load_event_rows(session, chain_id, 0)
+
+        tail = ev_rows[1:] if cached else ev_rows
+        events = cached + tuple(_row_to_event(r) for r in tail)
+        self._remember_events(chain_id, events)
+        return _row_to_chain(row, events)
+
+    async def _load_event_rows(
+        self, session: AsyncSession, chain_id: str, start: int
+    ) -> list[ChainEventRow]:
+        stmt = (
+            select(ChainEventRow)
+            .where(
+                ChainEventRow.chain_id == chain_id,
+                ChainEventRow.sequence >= start,
+            )
+            .order_by(ChainEventRow.sequence.asc())
+        )
+        return list((await session.execute(stmt)).scalars().all())
+
+    def _remember_events(self, chain_id: str, events: tuple[ChainEvent, ...]) -> None:
+        if not events:
+            return
+        self._event_cache[chain_id] = events
+        self._event_cache.move_to_end(chain_id)
+        while len(self._event_cache) > _EVENT_CACHE_MAX_CHAINS:
+            self._event_cache.popitem(last=False)
 
     async def list_all(self) -> list[GovernanceChain]:
         """Return every chain. Events are loaded for each.
@@ -91,19 +166,29 @@ class ChainRepository:
         for ev in ev_rows:
             events_by_chain.setdefault(ev.chain_id, []).append(ev)
 
-        return [_row_to_chain(r, events_by_chain.get(r.chain_id, [])) for r in rows]
+        return [
+            _row_to_chain(
+                r, [_row_to_event(ev) for ev in events_by_chain.get(r.chain_id, [])]
+            )
+            for r in rows
+        ]
 
     async def count_all(self) -> int:
         async with self._sessionmaker() as session:
             stmt = select(func.count()).select_from(GovernanceChainRow)
             return int((await session.execute(stmt)).scalar_one())
 
-    async def list_stale(self, older_than: datetime) -> list[str]:
+    async def list_stale(
+        self,
+        older_than: datetime,
+        statuses: Optional[Iterable[ChainStatus]] = None,
+    ) -> list[str]:
         """Return chain_ids whose latest activity is strictly before the cutoff.
 
         Latest activity = latest event timestamp if any events exist,
         otherwise the chain's ``created_at``. Mirrors the logic in
-        :func:`gavel.gateway.cleanup_stale_chains`.
+        :func:`gavel.gateway.cleanup_stale_chains`. When ``statuses`` is
+        given, only chains currently in one of those statuses are returned.
         """
         async with self._sessionmaker() as session:
             # Latest event timestamp per chain (may be NULL for empty chains).
@@ -125,6 +210,12 @@ class ChainRepository:
                 latest_ev.c.cid == GovernanceChainRow.chain_id,
                 isouter=True,
             )
+            if statuses is not None:
+                stmt = stmt.where(
+                    GovernanceChainRow.status.in_(
+                        [ChainStatus(s).value for s in statuses]
+                    )
+                )
             rows = (await session.execute(stmt)).all()
 
         stale: list[str] = []
@@ -157,8 +248,21 @@ class ChainRepository:
 
         async with self._sessionmaker() as session:
             async with session.begin():
-                existing = await session.get(GovernanceChainRow, chain.chain_id)
-                if existing is None:
+                # One round trip for both the chain row and the highest
+                # persisted sequence (served by the (chain_id, sequence) PK).
+                last_seq = (
+                    select(func.max(ChainEventRow.sequence))
+                    .where(ChainEventRow.chain_id == chain.chain_id)
+                    .scalar_subquery()
+                )
+                found = (
+                    await session.execute(
+                        select(GovernanceChainRow, last_seq).where(
+                            GovernanceChainRow.chain_id == chain.chain_id
+                        )
+                    )
+                ).first()
+                if found is None:
                     session.add(
                         GovernanceChainRow(
                             chain_id=chain.chain_id,
@@ -167,23 +271,27 @@ class ChainRepository:
                             actor_roles=actor_roles_json,
                         )
                     )
+                    # Event rows reference the chain row, so a chain that
+                    # is new to the DB has none.
+                    persisted = 0
                 else:
+                    existing, max_seq = found
                     existing.status = _status_str(chain.status)
                     existing.actor_roles = actor_roles_json
                     # created_at is immutable; don't overwrite.
-
-                # Which sequences are already persisted?
-                stmt = select(ChainEventRow.sequence).where(
-                    ChainEventRow.chain_id == chain.chain_id
-                )
-                existing_seqs = {
-                    int(s) for s in (await session.execute(stmt)).scalars().all()
-                }
-
-                for idx, event in enumerate(chain.events):
-                    if idx in existing_seqs:
-                        continue
-                    session.add(_event_to_row(chain.chain_id, idx, event))
+                    persisted = 0 if max_seq is None else int(max_seq) + 1
+
+                # Events are only ever appended, so the persisted rows are
+                # exactly sequences 0..persisted-1.
+                new_rows = [
+                    _event_values(chain.chain_id, idx, event)
+                    for idx, event in enumerate(chain.events)
+                    if idx >= persisted
+                ]
+                if new_rows:
+                    # Flush the chain row first so the FK is satisfied.
+                    await session.flush()
+                    await session.execute(insert(ChainEventRow), new_rows)
 
     async def append_event(self, chain_id: str, event: ChainEvent) -> None:
         """Hot-path single-event insert. Caller holds the chain lock.
@@ -191,13 +299,29 @@ class ChainRepository:
         Sequence is derived from the current row count to match the
         in-memory append semantics. The chain row is assumed to exist.
         """
+        await self.append_events(chain_id, [event])
+
+    async def append_events(self, chain_id: str, events: list[ChainEvent]) -> None:
+        """Insert several events in one statement. Caller holds the chain lock.
+
+        Sequences continue from the current row count, in list order.
+        The whole batch commits or rolls back together.
+        """
+        if not events:
+            return
         async with self._sessionmaker() as session:
             async with session.begin():
                 stmt = select(func.count()).select_from(ChainEventRow).where(
                     ChainEventRow.chain_id == chain_id
                 )
-                seq = int((await session.execute(stmt)).scalar_one())
-                session.add(_event_to_row(chain_id, seq, event))
+                base = int((await session.execute(stmt)).scalar_one())
+                await session.execute(
+                    insert(ChainEventRow),
+                    [
+                        _event_values(chain_id, base + offset, event)
+                        for offset, event in enumerate(events)
+                    ],
+                )
 
     async def delete(self, chain_id: str) -> None:
         """Delete a chain and all its events.
@@ -205,6 +329,7 @@ class ChainRepository:
         Events are deleted first to respect the FK from
         ``chain_events.chain_id`` → ``governance_chains.chain_id``.
         """
+        self._event_cache.pop(chain_id, None)
         async with self._sessionmaker() as session:
             async with session.begin():
                 await session.execute(
@@ -229,20 +354,20 @@ def _status_str(status) -> str:
     return str(status)
 
 
-def _event_to_row(chain_id: str, sequence: int, event: ChainEvent) -> ChainEventRow:
-    return ChainEventRow(
-        chain_id=chain_id,
-        sequence=sequence,
-        event_id=event.event_id,
-        event_type=event.event_type.value,
-        actor_id=event.actor_id,
-        role_used=event.role_used,
-        timestamp=event.timestamp,
-        payload=event.payload,
-        prev_hash=event.prev_hash,
-        event_hash=event.event_hash,
-        request_id=event.request_id,
-    )
+def _event_values(chain_id: str, sequence: int, event: ChainEvent) -> dict:
+    return {
+        "chain_id": chain_id,
+        "sequence": sequence,
+        "event_id": event.event_id,
+        "event_type": event.event_type.value,
+        "actor_id": event.actor_id,
+        "role_used": event.role_used,
+        "timestamp": event.timestamp,
+        "payload": event.payload,
+        "prev_hash": event.prev_hash,
+        "event_hash": event.event_hash,
+        "request_id": event.request_id,
+    }
 
 
 def _row_to_event(row: ChainEventRow) -> ChainEvent:
@@ -262,12 +387,12 @@ def _row_to_event(row: ChainEventRow) -> ChainEvent:
 
 def _row_to_chain(
     chain_row: GovernanceChainRow,
-    event_rows: list[ChainEventRow],
+    events: list[ChainEvent] | tuple[ChainEvent, ...],
 ) -> GovernanceChain:
     chain = GovernanceChain(chain_id=chain_row.chain_id)
     chain.status = ChainStatus(chain_row.status)
     chain.created_at = _ensure_aware(chain_row.created_at)
-    chain.events = [_row_to_event(r) for r in event_rows]
+    chain.events = list(events)
     chain._actor_roles = {
         aid: set(roles or []) for aid, roles in (chain_row.actor_roles or {}).items()
     }
@@ -6,20 +6,25 @@ Current in-memory semantics (``get_evidence_packets()`` returns a
 * ``get(chain_id)``   → ``evidence_packets.get(chain_id)``
 * ``save(cid, pkt)``  → ``evidence_packets[cid] = pkt``  (upsert)
 * ``delete(cid)``     → ``evidence_packets.pop(cid, None)``
+* ``save_many(pkts)`` → ``evidence_packets.update(pkts)``
 
 The underlying :class:`EvidencePacketRow` has ``packet_id`` as its PK,
 but there is at most one packet per chain today, so we upsert keyed on
 ``chain_id``. ``ScopeDeclaration`` is serialised as a JSON dict using
 ``dataclasses.asdict``; on load we rebuild the dataclass.
+
+``save_many`` is the bulk replay/import path: one ``DELETE … IN`` plus a
+single executemany ``INSERT`` in one transaction, instead of a
+delete + insert + commit per packet.
 """
 
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Optional
+from typing import Mapping, Optional
 
 from sqlalchemy import delete as sa_delete
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from gavel.blastbox import EvidencePacket, ScopeDeclaration
@@ -45,16 +50,25 @@ class EvidenceRepository:
 
     async def save(self, chain_id: str, packet: EvidencePacket) -> None:
         """Upsert: one packet per chain. Replaces any prior packet."""
+        await self.save_many({chain_id: packet})
+
+    async def save_many(self, packets: Mapping[str, EvidencePacket]) -> None:
+        """Bulk upsert of ``{chain_id: packet}`` in a single transaction."""
+        if not packets:
+            return
         async with self._sessionmaker() as session:
             async with session.begin():
                 # Upsert semantics match dict[chain_id] = packet: wipe any
                 # prior row (regardless of its packet_id) and insert fresh.
                 await session.execute(
                     sa_delete(EvidencePacketRow).where(
-                        EvidencePacketRow.chain_id == chain_id
+                        EvidencePacketRow.chain_id.in_(list(packets))
                     )
                 )
-                session.add(_packet_to_row(chain_id, packet))
+                await session.execute(
+                    insert(EvidencePacketRow),
+                    [_packet_values(cid, pkt) for cid, pkt in packets.items()],
+                )
 
     async def delete(self, chain_id: str) -> None:
         async with self._sessionmaker() as session:
@@ -69,29 +83,29 @@ class EvidenceRepository:
 # ── helpers ───────────────────────────────────────────────────────
 
 
-def _packet_to_row(chain_id: str, packet: EvidencePacket) -> EvidencePacketRow:
-    return EvidencePacketRow(
-        packet_id=packet.packet_id,
-        chain_id=chain_id,
-        intent_event_id=packet.intent_event_id,
-        command_argv=list(packet.command_argv),
-        scope=asdict(packet.scope) if packet.scope is not None else {},
-        exit_code=packet.exit_code,
-        stdout_hash=packet.stdout_hash,
-        stderr_hash=packet.stderr_hash,
-        diff_hash=packet.diff_hash,
-        stdout_preview=packet.stdout_preview,
-        files_modified=list(packet.files_modified),
-        files_created=list(packet.files_created),
-        files_deleted=list(packet.files_deleted),
-        image=packet.image,
-        image_digest=packet.image_digest,
-        network_mode=packet.network_mode,
-        cpu=packet.cpu,
-        memory=packet.memory,
-        started_at=packet.started_at,
-        finished_at=packet.finished_at,
-    )
+def _packet_values(chain_id: str, packet: EvidencePacket) -> dict:
+    return {
+        "packet_id": packet.packet_id,
+        "chain_id": chain_id,
+        "intent_event_id": packet.intent_event_id,
+        "command_argv": list(packet.command_argv),
+        "scope": asdict(packet.scope) if packet.scope is not None else {},
+        "exit_code": packet.exit_code,
+        "stdout_hash": packet.stdout_hash,
+        "stderr_hash": packet.stderr_hash,
+        "diff_hash": packet.diff_hash,
+        "stdout_preview": packet.stdout_preview,
+        "files_modified": list(packet.files_modified),
+        "files_created": list(packet.files_created),
+        "files_deleted": list(packet.files_deleted),
+        "image": packet.image,
+        "image_digest": packet.image_digest,
+        "network_mode": packet.network_mode,
+        "cpu": packet.cpu,
+        "memory": packet.memory,
+        "started_at": packet.started_at,
+        "finished_at": packet.finished_at,
+    }
 
 
 def _row_to_packet(row: EvidencePacketRow) -> EvidencePacket:
@@ -11,8 +11,9 @@ Per the Wave 2A spec: ``get()`` returns ``None`` when absent — do NOT
 bake the default ``ReviewResult()`` into the repo. Callers that need
 the default (e.g. ``governance_router.py:230``) handle it themselves.
 
-``Finding`` is a dataclass; we serialise findings as a list of dicts
-via ``dataclasses.asdict`` and rehydrate on load. The storage row
+``Finding`` is a flat dataclass; we serialise findings as a list of
+dicts built field by field (``dataclasses.asdict`` would recurse and
+deep-copy for no gain) and rehydrate on load. The storage row
 keys by ``packet_id``; we upsert keyed on ``chain_id`` to match the
 dict semantics (one review per chain today).
 """
@@ -20,7 +21,6 @@ dict semantics (one review per chain today).
 from __future__ import annotations
 
 import uuid
-from dataclasses import asdict
 from typing import Optional
 
 from sqlalchemy import delete as sa_delete
@@ -83,7 +83,10 @@ def _result_to_row(chain_id: str, result: ReviewResult) -> ReviewResultRow:
         verdict=result.verdict.value
         if isinstance(result.verdict, ReviewVerdict)
         else str(result.verdict),
-        findings=[asdict(f) if isinstance(f, Finding) else dict(f) for f in result.findings],
+        findings=[
+            _finding_to_dict(f) if isinstance(f, Finding) else dict(f)
+            for f in result.findings
+        ],
         risk_delta=float(result.risk_delta),
         scope_compliance=result.scope_compliance,
         review_hash=result.review_hash,
@@ -93,6 +96,10 @@ def _result_to_row(chain_id: str, result: ReviewResult) -> ReviewResultRow:
     )
 
 
+def _finding_to_dict(f: Finding) -> dict:
+    return {"check": f.check, "passed": f.passed, "detail": f.detail, "severity": f.severity}
+
+
 def _row_to_result(row: ReviewResultRow) -> ReviewResult:
     findings: list[Finding] = []
     for f in row.findings or []:
@@ -199,6 +199,23 @@ _CAPABILITY_CLAIMS: list[tuple[re.Pattern[str], str]] = [
 ]
 
 
+def _any_of(library: list[tuple]) -> re.Pattern[str]:
+    """Fuse a pattern library into one alternation.
+
+    Clean output is the common case; one pass over the text rules out
+    every pattern in the library before the per-pattern searches run.
+    """
+    return re.compile(
+        "|".join(f"(?:{entry[0].pattern})" for entry in library),
+        re.IGNORECASE,
+    )
+
+
+_OVERCONFIDENCE_ANY = _any_of(_OVERCONFIDENCE_PATTERNS)
+_IDENTITY_ANY = _any_of(_IDENTITY_PATTERNS)
+_CAPABILITY_ANY = _any_of(_CAPABILITY_CLAIMS)
+
+
 # ── Detector ───────────────────────────────────────────────────
 
 class DeceptionDetector:
@@ -480,6 +497,9 @@ class DeceptionDetector:
         output_text: str,
     ) -> list[DeceptionFinding]:
         """D3: Detect overconfidence markers in output."""
+        if not _OVERCONFIDENCE_ANY.search(output_text):
+            return []
+
         findings: list[DeceptionFinding] = []
 
         for pattern, name, confidence in _OVERCONFIDENCE_PATTERNS:
@@ -509,20 +529,20 @@ class DeceptionDetector:
         output_lower = output_text.lower()
 
         for op_pattern, expected_caveats, description in _RISK_OPERATIONS:
-            if op_pattern.search(output_text):
+            match = op_pattern.search(output_text)
+            if match:
                 has_caveat = any(
                     caveat.lower() in output_lower
                     for caveat in expected_caveats
                 )
                 if not has_caveat:
-                    match = op_pattern.search(output_text)
                     findings.append(DeceptionFinding(
                         signal=DeceptionSignal.SELECTIVE_DISCLOSURE,
                         agent_id=agent_id,
                         chain_id=chain_id,
                         severity="LOW",
                         confidence=0.45,
-                        evidence=match.group(0) if match else "",
+                        evidence=match.group(0),
                         context=description,
                     ))
 
@@ -535,6 +555,9 @@ class DeceptionDetector:
         output_text: str,
     ) -> list[DeceptionFinding]:
         """D5: Detect claims of being human or having false authority."""
+        if not _IDENTITY_ANY.search(output_text):
+            return []
+
         findings: list[DeceptionFinding] = []
 
         for pattern, name, severity, confidence in _IDENTITY_PATTERNS:
@@ -560,7 +583,7 @@ class DeceptionDetector:
         enrollment_capabilities: Optional[dict[str, bool]] = None,
     ) -> list[DeceptionFinding]:
         """D6: Check if output claims capabilities not in enrollment manifest."""
-        if not enrollment_capabilities:
+        if not enrollment_capabilities or not _CAPABILITY_ANY.search(output_text):
             return []
 
         findings: list[DeceptionFinding] = []
@@ -165,52 +165,75 @@ def get_chain_lock_manager() -> ChainLockManager:
 get_sessionmaker = db_engine.get_sessionmaker
 
 
+# Repositories built for the most recent sessionmaker. Only one sessionmaker
+# is remembered: a memo keyed on every sessionmaker ever seen would keep old
+# engines (and the chain repository's per-sessionmaker event cache) alive.
+_repos: dict[type, object] = {}
+_repos_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def _repo_for(repo_cls: type, sm: async_sessionmaker[AsyncSession]):
+    """One repository per class for the current sessionmaker, not one per request.
+
+    Repositories only hold the sessionmaker (plus, for chains, the
+    sessionmaker's shared event cache), so the instances are reusable.
+    """
+    global _repos_sessionmaker
+    if sm is not _repos_sessionmaker:
+        _repos.clear()
+        _repos_sessionmaker = sm
+    repo = _repos.get(repo_cls)
+    if repo is None:
+        repo = _repos[repo_cls] = repo_cls(sm)
+    return repo
+
+
 def get_chain_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> ChainRepository:
-    return ChainRepository(sm)
+    return _repo_for(ChainRepository, sm)
 
 
 def get_evidence_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> EvidenceRepository:
-    return EvidenceRepository(sm)
+    return _repo_for(EvidenceRepository, sm)
 
 
 def get_review_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> ReviewRepository:
-    return ReviewRepository(sm)
+    return _repo_for(ReviewRepository, sm)
 
 
 def get_execution_token_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> ExecutionTokenRepository:
-    return ExecutionTokenRepository(sm)
+    return _repo_for(ExecutionTokenRepository, sm)
 
 
 def get_agent_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> AgentRepository:
-    return AgentRepository(sm)
+    return _repo_for(AgentRepository, sm)
 
 
 def get_enrollment_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> EnrollmentRepository:
-    return EnrollmentRepository(sm)
+    return _repo_for(EnrollmentRepository, sm)
 
 
 def get_governance_token_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> GovernanceTokenRepository:
-    return GovernanceTokenRepository(sm)
+    return _repo_for(GovernanceTokenRepository, sm)
 
 
 def get_incident_repo(
     sm: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ) -> IncidentRepository:
-    return IncidentRepository(sm)
+    return _repo_for(IncidentRepository, sm)
 
 
 # ---------------------------------------------------------------------------
@@ -327,9 +350,11 @@ async def require_gavel_token(
 
 def reset_dependency_cache() -> None:
     """Clear all lru_cache singletons. Test-only helper."""
-    global _rate_limiter_instance, _event_bus_instance
+    global _rate_limiter_instance, _event_bus_instance, _repos_sessionmaker
     _rate_limiter_instance = None
     _event_bus_instance = None
+    _repos.clear()
+    _repos_sessionmaker = None
 
     for fn in (
         get_constitution,
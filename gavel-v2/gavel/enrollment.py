@@ -78,12 +78,54 @@ import re as _re
 # enrollment applications) that paraphrase the prohibition without using
 # the Act's exact wording.
 #
-# Patterns are compiled once at module load for performance.
+# Patterns are compiled once at module load for performance. A pattern of
+# the form ``a.*b.*c`` is not run as one regex: with DOTALL, backtracking
+# over every ``.*`` makes a miss cost O(n^3) on long, repetitive input, and
+# enrollment text is caller-supplied. Each pattern is split on ``.*`` and its
+# terms are searched left to right from the end of the previous hit, which
+# accepts exactly the same texts in linear time.
 
-_PROHIBITED_PATTERNS: list[tuple[str, list["_re.Pattern[str]"]]] = []
+_ORDERED_FLAGS = _re.IGNORECASE | _re.DOTALL
 
-def _compile_prohibited() -> list[tuple[str, list["_re.Pattern[str]"]]]:
-    """Build and compile Article 5 pattern families."""
+
+class _OrderedTerms:
+    """Regex terms that must all occur, in order, anywhere in the text."""
+
+    __slots__ = ("terms",)
+
+    def __init__(self, pattern: str):
+        self.terms = tuple(_re.compile(t, _ORDERED_FLAGS) for t in pattern.split(".*"))
+
+    def search(self, text: str) -> bool:
+        pos = 0
+        for term in self.terms:
+            m = term.search(text, pos)
+            if m is None:
+                return False
+            pos = m.end()
+        return True
+
+
+class _PatternFamily:
+    """Every pattern for one Article 5 citation; matches if any pattern does."""
+
+    __slots__ = ("patterns",)
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = tuple(_OrderedTerms(p) for p in patterns)
+
+    def search(self, text: str) -> bool:
+        return any(p.search(text) for p in self.patterns)
+
+
+_PROHIBITED_PATTERNS: list[tuple[str, _PatternFamily]] = []
+
+def _compile_prohibited() -> list[tuple[str, _PatternFamily]]:
+    """Build and compile Article 5 pattern families.
+
+    A ``.*`` may only appear between terms, never inside a group, since
+    patterns are split on it.
+    """
     specs: list[tuple[str, list[str]]] = [
         # Art. 5(1)(a) — Subliminal manipulation
         ("Art. 5(1)(a): Subliminal techniques to materially distort behavior", [
@@ -109,7 +151,8 @@ def _compile_prohibited() -> list[tuple[str, list["_re.Pattern[str]"]]]:
             r"mass\s+surveillance",
             r"(facial\s+recogni|face\s+match)\w*.*\b(public|cctv|crowd|surveillance|watchlist)",
             r"real.?time.*identif\w*.*\b(face|biometric|individual)",
-            r"(cctv|surveillance|live\b.*\bvideo).*\b(identif|recogni|match)\w*.*\b(face|individual|watchlist)",
+            r"(cctv|surveillance).*\b(identif|recogni|match)\w*.*\b(face|individual|watchlist)",
+            r"live\b.*\bvideo.*\b(identif|recogni|match)\w*.*\b(face|individual|watchlist)",
         ]),
         # Art. 5(1)(d) — Individual predictive policing
         ("Art. 5(1)(d): Individual predictive policing based solely on profiling", [
@@ -124,10 +167,7 @@ def _compile_prohibited() -> list[tuple[str, list["_re.Pattern[str]"]]]:
             r"(emotion|sentiment)\w*.*\b(student|classroom|school|university|education)",
         ]),
     ]
-    return [
-        (citation, [_re.compile(p, _re.IGNORECASE | _re.DOTALL) for p in patterns])
-        for citation, patterns in specs
-    ]
+    return [(citation, _PatternFamily(patterns)) for citation, patterns in specs]
 
 _PROHIBITED_PATTERNS = _compile_prohibited()
 
@@ -151,9 +191,8 @@ def classify_risk_category(purpose: PurposeDeclaration, capabilities: Capability
             return HighRiskCategory.PROHIBITED
 
     # Regex pass catches paraphrased descriptions that keyword matching misses
-    for _citation, patterns in _PROHIBITED_PATTERNS:
-        if any(p.search(text) for p in patterns):
-            return HighRiskCategory.PROHIBITED
+    if any(family.search(text) for _citation, family in _PROHIBITED_PATTERNS):
+        return HighRiskCategory.PROHIBITED
 
     for category, keywords in _RISK_CATEGORY_KEYWORDS.items():
         for keyword in keywords:
@@ -193,8 +232,8 @@ def detect_prohibited_practices(app: "EnrollmentApplication") -> list[str]:
         violations.append("Art. 5(1)(f): Emotion recognition in workplace or education institutions")
 
     # Layer 2: regex pattern families (catches paraphrases)
-    for citation, patterns in _PROHIBITED_PATTERNS:
-        if citation not in violations and any(p.search(text) for p in patterns):
+    for citation, family in _PROHIBITED_PATTERNS:
+        if citation not in violations and family.search(text):
             violations.append(citation)
 
     tools_text = " ".join(app.capabilities.tools).lower()
@@ -101,12 +101,13 @@ class OversightEvasionDetector:
         self._last_seen: dict[str, datetime] = {}
         self._suspended_agents: set[str] = set()
         self._suspended_signatures: dict[tuple, str] = {}  # (owner, display) -> old agent_id
-        self._declared_scopes: dict[str, list[str]] = {}
+        # Stored as tuples so scope checks are a single str.startswith call.
+        self._declared_scopes: dict[str, tuple[str, ...]] = {}
 
     # ---- configuration ----
 
     def declare_scope(self, agent_id: str, allowed_paths: list[str]) -> None:
-        self._declared_scopes[agent_id] = list(allowed_paths)
+        self._declared_scopes[agent_id] = tuple(allowed_paths)
 
     def mark_suspended(self, agent_id: str, owner: str, display_name: str) -> None:
         self._suspended_agents.add(agent_id)
@@ -223,7 +224,7 @@ class OversightEvasionDetector:
             touched.update(r.touched_paths)
         out_of_scope = sorted(
             p for p in touched
-            if not any(p.startswith(d) for d in declared)
+            if not p.startswith(declared)
         )
         if not out_of_scope:
             return []
@@ -162,8 +162,7 @@ class RedisEventBus:
 
     async def publish(self, event: DashboardEvent) -> None:
         """Serialize *event* to JSON and PUBLISH to Redis."""
-        data = event.model_dump(mode="json")
-        payload = json.dumps(data, default=str).encode("utf-8")
+        payload = event.model_dump_json().encode("utf-8")
         try:
             await self._redis.publish(REDIS_CHANNEL, payload)
         except Exception:
@@ -235,11 +234,7 @@ class RedisEventBus:
                 if message["type"] != "message":
                     continue
                 try:
-                    raw = message["data"]
-                    if isinstance(raw, bytes):
-                        raw = raw.decode("utf-8")
-                    data = json.loads(raw)
-                    event = DashboardEvent(**data)
+                    event = DashboardEvent.model_validate_json(message["data"])
                 except Exception:
                     logger.exception("RedisEventBus: failed to deserialize message")
                     continue
@@ -313,8 +308,7 @@ class PersistentEventBus:
 
         Returns the stream entry ID assigned by Redis.
         """
-        data = event.model_dump(mode="json")
-        payload = json.dumps(data, default=str)
+        payload = event.model_dump_json()
         try:
             entry_id: bytes = await self._redis.xadd(
                 STREAM_KEY, {"data": payload}
@@ -361,11 +355,8 @@ class PersistentEventBus:
             raw = fields.get(b"data") or fields.get("data")
             if raw is None:
                 continue
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
             try:
-                data = json.loads(raw)
-                ev = DashboardEvent(**data)
+                ev = DashboardEvent.model_validate_json(raw)
                 yield ev
                 last_seen = eid.decode() if isinstance(eid, bytes) else str(eid)
             except Exception:
@@ -411,11 +402,8 @@ class PersistentEventBus:
             raw = fields.get(b"data") or fields.get("data")
             if raw is None:
                 continue
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
             try:
-                data = json.loads(raw)
-                events.append(DashboardEvent(**data))
+                events.append(DashboardEvent.model_validate_json(raw))
             except Exception:
                 logger.exception("PersistentEventBus: failed to deserialize replayed event")
         return events
@@ -484,11 +472,8 @@ class PersistentEventBus:
                         raw = fields.get(b"data") or fields.get("data")
                         if raw is None:
                             continue
-                        if isinstance(raw, bytes):
-                            raw = raw.decode("utf-8")
                         try:
-                            data = json.loads(raw)
-                            event = DashboardEvent(**data)
+                            event = DashboardEvent.model_validate_json(raw)
                         except Exception:
                             logger.exception(
                                 "PersistentEventBus: failed to deserialize stream entry"
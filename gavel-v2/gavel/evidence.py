@@ -16,6 +16,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 from gavel.blastbox import EvidencePacket, ScopeDeclaration
@@ -28,7 +30,7 @@ class ReviewVerdict(str, Enum):
     WARN = "WARN"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single finding from the evidence review."""
 
@@ -38,7 +40,7 @@ class Finding:
     severity: str = "info"  # info, warn, fail
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """The output of a deterministic evidence review."""
 
@@ -48,6 +50,7 @@ class ReviewResult:
     scope_compliance: str = "FULL"
     review_hash: str = ""
     # D-3 Privacy: redacted outputs carry no PII/PHI; originals are dropped.
+    # Streams over the scan window keep only their scanned head + tail.
     redacted_stdout: str = ""
     redacted_stderr: str = ""
     privacy_findings: list[dict[str, Any]] = field(default_factory=list)
@@ -66,6 +69,44 @@ SECRET_PATTERNS = [
 ]
 
 
+def _any_of(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    """Fuse compiled patterns into one alternation, one scan per text.
+
+    Each alternative keeps its own case-insensitivity as a scoped flag, so
+    ``_any_of(ps).search(t)`` matches exactly when some ``p.search(t)`` does.
+    """
+    parts = []
+    for p in patterns:
+        flag = "i" if p.flags & re.IGNORECASE else ""
+        parts.append(f"(?{flag}:{p.pattern.removeprefix('(?i)')})")
+    return re.compile("|".join(parts))
+
+
+_SECRET_ANY = _any_of(SECRET_PATTERNS)
+
+
+# Stream scan window for the PII/PHI scan and redaction. Output beyond
+# head + tail is left out of the artifact, which keeps review latency flat
+# for multi-megabyte sandbox output. The fused secret search is linear and
+# still covers the whole stream.
+SCAN_HEAD_CHARS = 64 * 1024
+SCAN_TAIL_CHARS = 64 * 1024
+_SCAN_ELISION = "\n…\n"
+
+
+def _scan_window(text: str) -> tuple[str, bool]:
+    """Return the head + tail of *text* to scan, and whether it was cut."""
+    if len(text) <= SCAN_HEAD_CHARS + SCAN_TAIL_CHARS:
+        return text, False
+    return text[:SCAN_HEAD_CHARS] + _SCAN_ELISION + text[-SCAN_TAIL_CHARS:], True
+
+
+@lru_cache(maxsize=32)
+def _literal_any(literals: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation over escaped literals: a single-scan substring prefilter."""
+    return re.compile("|".join(map(re.escape, literals)))
+
+
 class EvidenceReviewer:
     """
     Deterministic evidence review engine.
@@ -114,10 +155,12 @@ class EvidenceReviewer:
             severity="fail" if packet.exit_code != 0 else "info",
         ))
 
-        # Check 2: Files within declared scope
+        # Check 2: Files within declared scope. str.startswith takes the
+        # whole prefix tuple in one C-level call.
+        allow_prefixes = tuple(declared_scope.allow_paths)
         scope_ok = True
-        for f in packet.files_modified + packet.files_created:
-            in_scope = any(f.startswith(p) for p in declared_scope.allow_paths)
+        for f in chain(packet.files_modified, packet.files_created):
+            in_scope = f.startswith(allow_prefixes)
             if not in_scope:
                 scope_ok = False
                 risk_delta += 0.3
@@ -134,8 +177,12 @@ class EvidenceReviewer:
                 detail="All files within declared scope",
             ))
 
-        # Check 3: Forbidden paths
-        for f in packet.files_modified + packet.files_created + packet.files_deleted:
+        # Check 3: Forbidden paths. Most paths are clean, so one fused
+        # scan rules them out before the per-pattern loop runs.
+        forbidden_any = _literal_any(tuple(self.forbidden_paths))
+        for f in chain(packet.files_modified, packet.files_created, packet.files_deleted):
+            if not forbidden_any.search(f):
+                continue
             for forbidden in self.forbidden_paths:
                 if forbidden in f:
                     risk_delta += 0.5
@@ -162,18 +209,16 @@ class EvidenceReviewer:
                 detail=f"Network mode: {packet.network_mode}",
             ))
 
-        # Check 5: Secrets in output
+        # Check 5: Secrets in output (whole stream)
         for content, label in [(stdout_content, "stdout"), (stderr_content, "stderr")]:
-            for pattern in SECRET_PATTERNS:
-                if pattern.search(content):
-                    risk_delta += 0.5
-                    findings.append(Finding(
-                        check="secret_detection",
-                        passed=False,
-                        detail=f"Potential secret detected in {label}",
-                        severity="fail",
-                    ))
-                    break
+            if _SECRET_ANY.search(content):
+                risk_delta += 0.5
+                findings.append(Finding(
+                    check="secret_detection",
+                    passed=False,
+                    detail=f"Potential secret detected in {label}",
+                    severity="fail",
+                ))
             else:
                 findings.append(Finding(
                     check="secret_detection",
@@ -181,6 +226,24 @@ class EvidenceReviewer:
                     detail=f"No secrets detected in {label}",
                 ))
 
+        # Oversized streams are PII-scanned (and redacted) as head + tail
+        # only. The unscanned middle blocks auto-approve, so padding output
+        # past the window cannot slip PII through a clean review.
+        stdout_content, stdout_cut = _scan_window(stdout_content)
+        stderr_content, stderr_cut = _scan_window(stderr_content)
+        for cut, label in [(stdout_cut, "stdout"), (stderr_cut, "stderr")]:
+            if cut:
+                findings.append(Finding(
+                    check="scan_window",
+                    passed=False,
+                    detail=(
+                        f"{label} too large to fully scan; only the first "
+                        f"{SCAN_HEAD_CHARS} and last {SCAN_TAIL_CHARS} chars were "
+                        f"scanned for PII/PHI"
+                    ),
+                    severity="warn",
+                ))
+
         # Check 5b: D-3 PII/PHI scan with redaction
         stdout_scan = scan_text(stdout_content)
         stderr_scan = scan_text(stderr_content)
@@ -216,7 +279,7 @@ class EvidenceReviewer:
         # Check 6: Unexpected deletions
         if packet.files_deleted:
             for f in packet.files_deleted:
-                in_scope = any(f.startswith(p) for p in declared_scope.allow_paths)
+                in_scope = f.startswith(allow_prefixes)
                 if not in_scope:
                     risk_delta += 0.3
                     findings.append(Finding(
@@ -226,8 +289,16 @@ class EvidenceReviewer:
                         severity="fail",
                     ))
 
-        has_failures = any(f.severity == "fail" and not f.passed for f in findings)
-        has_warnings = any(f.severity == "warn" and not f.passed for f in findings)
+        # One pass over the findings; a failure settles the verdict.
+        has_failures = has_warnings = False
+        for f in findings:
+            if f.passed:
+                continue
+            if f.severity == "fail":
+                has_failures = True
+                break
+            if f.severity == "warn":
+                has_warnings = True
 
         if has_failures:
             verdict = ReviewVerdict.FAIL
@@ -33,7 +33,7 @@ from .events import EventBus, DashboardEvent
 from .hooks import classify_risk, should_govern
 from .prompt_injection import PromptInjectionDetector as _PIDetector, DetectionResult
 from .rate_limit import RateLimiter, BudgetTracker
-from .tiers import TierPolicy, AutonomyTier, TIER_TABLE
+from .tiers import TierPolicy, AutonomyTier, TIER_REQUIREMENTS
 from .dependencies import (
     ChainLockManager,
     get_agent_os,
@@ -316,7 +316,7 @@ async def gate(
 
     # 5. Determine governance tier from agent record
     agent_tier = AutonomyTier(record.autonomy_tier)
-    tier_reqs = TIER_TABLE[agent_tier]
+    tier_reqs = TIER_REQUIREMENTS[agent_tier]
 
     # 6. Heartbeat
     await agent_registry.heartbeat(
@@ -23,6 +23,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
 
+from gavel.body_limit import DEFAULT_MAX_BODY_BYTES, BodySizeLimitMiddleware
+from gavel.compression import StreamSafeGZipMiddleware
 from gavel.request_id import RequestIDMiddleware, configure_request_id_logging
 
 from gavel.chain import ChainStatus
@@ -46,6 +48,7 @@ from gavel.routers import agent_router, governance_router, system_router
 
 
 BLOCKED_PATTERNS = ["rm -rf", "drop table", "delete from", "format c:", "truncate", "shutdown"]
+SENSITIVE_PATH_MARKERS = (".env", "credentials", "secret", "password", ".key", "token")
 
 
 def _load_cedar_rules(engine) -> None:
@@ -55,8 +58,8 @@ def _load_cedar_rules(engine) -> None:
     ``require_gavel_token`` dependency level — governance tokens are only
     issued to enrolled agents — so it is no longer duplicated here.
     """
-    import re
     from gavel.agt_compat import PolicyRule, ActionType
+    from .hooks import is_high_risk_command
 
     all_types = list(ActionType)
 
@@ -88,14 +91,11 @@ def _load_cedar_rules(engine) -> None:
         cmd = req.parameters.get("command", "")
         if not cmd:
             return True
+        lowered = cmd.lower()
         for pat in BLOCKED_PATTERNS:
-            if pat in cmd.lower():
+            if pat in lowered:
                 return False
-        from .hooks import HIGH_RISK_PATTERNS
-        for pat in HIGH_RISK_PATTERNS:
-            if re.search(pat, cmd, re.IGNORECASE):
-                return False
-        return True
+        return not is_high_risk_command(cmd)
 
     engine.add_custom_rule(PolicyRule(
         rule_id="cedar-dangerous-commands",
@@ -110,8 +110,7 @@ def _load_cedar_rules(engine) -> None:
         path = req.parameters.get("file_path", "").lower()
         if not path:
             return True
-        sensitive = [".env", "credentials", "secret", "password", ".key", "token"]
-        return not any(s in path for s in sensitive)
+        return not any(s in path for s in SENSITIVE_PATH_MARKERS)
 
     engine.add_custom_rule(PolicyRule(
         rule_id="cedar-sensitive-file-guard",
@@ -162,15 +161,12 @@ async def cleanup_stale_chains(ttl_seconds: int = DEFAULT_CHAIN_TTL_SECONDS) ->
 
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(seconds=ttl_seconds)
-    stale_ids = await chain_repo.list_stale(cutoff)
+    # Status is filtered in the same query, so no chain is rehydrated
+    # just to find out it is still in flight.
+    stale_ids = await chain_repo.list_stale(cutoff, statuses=_TERMINAL_STATUSES)
 
     removed = 0
     for chain_id in stale_ids:
-        chain = await chain_repo.get(chain_id)
-        if chain is None:
-            continue
-        if chain.status not in _TERMINAL_STATUSES:
-            continue
         async with chain_locks.lock(chain_id):
             await chain_repo.delete(chain_id)
             await evidence_repo.delete(chain_id)
@@ -194,6 +190,25 @@ async def _periodic_cleanup(interval_seconds: int = 300, ttl_seconds: int = DEFA
             _cleanup_log.exception("Error during periodic chain cleanup")
 
 
+_MIGRATE_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+async def _read_tail(stream: asyncio.StreamReader | None, limit: int) -> bytes:
+    """Drain *stream* to EOF, keeping only the last *limit* bytes.
+
+    Unlike ``communicate()``, memory stays bounded no matter how much
+    the child writes; the tail is what matters for error reporting.
+    """
+    if stream is None:
+        return b""
+    buf = bytearray()
+    while chunk := await stream.read(65536):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[:-limit]
+    return bytes(buf)
+
+
 async def _auto_migrate() -> None:
     """Run Alembic migrations at startup so a fresh ``uvicorn`` just works.
 
@@ -219,10 +234,14 @@ async def _auto_migrate() -> None:
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
-    stdout, stderr = await proc.communicate()
+    _, stderr = await asyncio.gather(
+        _read_tail(proc.stdout, _MIGRATE_OUTPUT_TAIL_BYTES),
+        _read_tail(proc.stderr, _MIGRATE_OUTPUT_TAIL_BYTES),
+    )
+    await proc.wait()
     if proc.returncode != 0:
-        log.error("Auto-migrate failed (exit %d): %s", proc.returncode, stderr.decode())
-        raise RuntimeError(f"Alembic migration failed: {stderr.decode()}")
+        log.error("Auto-migrate failed (exit %d): %s", proc.returncode, stderr.decode(errors="replace"))
+        raise RuntimeError(f"Alembic migration failed: {stderr.decode(errors='replace')}")
     log.info("Auto-migrate complete")
 
 
@@ -263,6 +282,11 @@ app.include_router(system_router, prefix="/v1")
 
 app.mount("/static", StaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")), name="static")
 
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=int(os.environ.get("GAVEL_MAX_BODY_BYTES", DEFAULT_MAX_BODY_BYTES)),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:8100", "http://localhost:3000", "http://localhost:8000"],
@@ -270,6 +294,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    StreamSafeGZipMiddleware,
+    minimum_size=1024,
+    stream_paths=["/v1/events/stream"],
+)
+
 app.add_middleware(RequestIDMiddleware)
 
 configure_request_id_logging("gavel")
@@ -43,6 +43,34 @@ HIGH_RISK_PATTERNS = [
     r"pip\s+install(?!.*-e)",
 ]
 
+# All of HIGH_RISK_PATTERNS as one case-insensitive alternation, so a
+# command is checked in a single regex call instead of one per pattern.
+HIGH_RISK_RE = re.compile(
+    "|".join(f"(?:{p})" for p in HIGH_RISK_PATTERNS), re.IGNORECASE
+)
+
+# A literal every HIGH_RISK_PATTERNS match must contain. Plain substring
+# tests on these are far cheaper than the regex and rule out most benign
+# commands. Non-ASCII commands skip the prefilter, because re.IGNORECASE
+# also folds a few non-ASCII letters (İ, ı) onto ASCII ones.
+_HIGH_RISK_LITERALS = (
+    "rm", "git", "docker", "kubectl", "drop", "truncate",
+    "format", "shutdown", "curl", "npm", "pip",
+)
+
+
+def is_high_risk_command(command: str) -> bool:
+    """Return True if *command* matches any of HIGH_RISK_PATTERNS."""
+    if command.isascii():
+        lowered = command.lower()
+        if not any(lit in lowered for lit in _HIGH_RISK_LITERALS):
+            return False
+    return HIGH_RISK_RE.search(command) is not None
+
+
+# Substrings of a Write path that mark it as a credential/secret file
+SENSITIVE_WRITE_MARKERS = (".env", "credentials", "secret", "password", ".key")
+
 
 def classify_risk(tool_name: str, args: dict[str, Any] | None = None) -> float:
     """Classify the risk of a Claude Code tool call.
@@ -53,13 +81,13 @@ def classify_risk(tool_name: str, args: dict[str, Any] | None = None) -> float:
 
     if tool_name == "Bash" and args:
         command = args.get("command", "")
-        for pattern in HIGH_RISK_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return min(1.0, base + 0.3)
+        if is_high_risk_command(command):
+            return min(1.0, base + 0.3)
 
     if tool_name == "Write" and args:
         path = args.get("file_path", "")
-        if any(s in path.lower() for s in [".env", "credentials", "secret", "password", ".key"]):
+        lowered = path.lower()
+        if any(s in lowered for s in SENSITIVE_WRITE_MARKERS):
             return 0.9
 
     return base
@@ -88,6 +116,21 @@ def format_action_log(
     }
 
 
+# Scope breadth per tool — how wide the blast radius is
+SCOPE_BREADTH: dict[str, float] = {
+    "Read": 0.1,
+    "Glob": 0.1,
+    "Grep": 0.1,
+    "Write": 0.1,
+    "Edit": 0.1,
+    "NotebookEdit": 0.1,
+    "WebSearch": 0.2,
+    "WebFetch": 0.2,
+    "Bash": 0.5,
+    "Agent": 0.6,
+}
+
+
 def build_risk_factors(tool_name: str, tool_input: dict) -> dict:
     """Bridge Claude Code tool calls to the RiskFactors structure used by TierPolicy.
 
@@ -113,20 +156,7 @@ def build_risk_factors(tool_name: str, tool_input: dict) -> dict:
         kw in scan_values for kw in ("user", "customer", "email", "ssn", "password")
     )
 
-    # Scope breadth — how wide the blast radius is
-    scope_breadth_map: dict[str, float] = {
-        "Read": 0.1,
-        "Glob": 0.1,
-        "Grep": 0.1,
-        "Write": 0.1,
-        "Edit": 0.1,
-        "NotebookEdit": 0.1,
-        "WebSearch": 0.2,
-        "WebFetch": 0.2,
-        "Bash": 0.5,
-        "Agent": 0.6,
-    }
-    scope_breadth = scope_breadth_map.get(tool_name, 0.3)
+    scope_breadth = SCOPE_BREADTH.get(tool_name, 0.3)
 
     return {
         "action_type_base": action_type_base,
@@ -138,6 +168,27 @@ def build_risk_factors(tool_name: str, tool_input: dict) -> dict:
     }
 
 
+# Commands whose presence in a Bash call implies network access
+_NETWORK_COMMANDS = ("curl", "wget", "fetch")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _has_word(text: str, word: str) -> bool:
+    """Whether *word* occurs in *text* as a whole word (regex ``\\bword\\b``)."""
+    i = text.find(word)
+    end = len(word)
+    while i != -1:
+        if (i == 0 or not _is_word_char(text[i - 1])) and (
+            i + end == len(text) or not _is_word_char(text[i + end])
+        ):
+            return True
+        i = text.find(word, i + 1)
+    return False
+
+
 def extract_scope_from_tool_input(tool_name: str, tool_input: dict) -> dict:
     """Auto-generate scope declarations from Claude Code tool inputs.
 
@@ -166,7 +217,7 @@ def extract_scope_from_tool_input(tool_name: str, tool_input: dict) -> dict:
             t for t in tokens
             if t.startswith("/") or t.startswith("./") or ("/" in t and not t.startswith("-"))
         ]
-        allow_network = bool(re.search(r"\b(curl|wget|fetch)\b", command))
+        allow_network = any(_has_word(command, w) for w in _NETWORK_COMMANDS)
         return {
             "allow_paths": paths if paths else ["."],
             "allow_commands": [command],
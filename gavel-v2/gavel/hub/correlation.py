@@ -62,15 +62,16 @@ class CrossMachineCorrelator:
                 endpoint_agents[e.endpoint_id].add(e.agent_id)
 
             if len(endpoint_agents) >= 2:
-                all_agents = []
                 all_endpoints = list(endpoint_agents.keys())
-                for agents in endpoint_agents.values():
-                    all_agents.extend(agents)
+                # Agents across all endpoints, deduped in a single pass
+                all_agents = list(dict.fromkeys(
+                    a for agents in endpoint_agents.values() for a in agents
+                ))
 
-                if len(set(all_agents)) >= 2:
+                if len(all_agents) >= 2:
                     finding = CorrelationFinding(
                         signal=CorrelationSignal.COORDINATED_TIMING,
-                        agents=list(set(all_agents)),
+                        agents=all_agents,
                         endpoints=all_endpoints,
                         evidence={"time_bucket": bucket, "event_count": len(bucket_events)},
                         severity="medium",
@@ -91,13 +92,13 @@ class CrossMachineCorrelator:
                 target_accesses[target].append(e)
 
         for target, access_events in target_accesses.items():
-            endpoints = set(e.endpoint_id for e in access_events)
+            endpoints = list(dict.fromkeys(e.endpoint_id for e in access_events))
             if len(endpoints) >= 2 and len(access_events) >= self._shared_target_threshold:
-                agents = list(set(e.agent_id for e in access_events))
+                agents = list(dict.fromkeys(e.agent_id for e in access_events))
                 finding = CorrelationFinding(
                     signal=CorrelationSignal.SHARED_TARGET,
                     agents=agents,
-                    endpoints=list(endpoints),
+                    endpoints=endpoints,
                     evidence={"target": target, "access_count": len(access_events)},
                     severity="high",
                     description=f"Agents on {len(endpoints)} endpoints accessed '{target}' {len(access_events)} times",
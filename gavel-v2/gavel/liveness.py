@@ -25,7 +25,7 @@ class EscalationLevel(str, Enum):
     TIMED_OUT = "TIMED_OUT" # SLA breached, auto-deny
 
 
-@dataclass
+@dataclass(slots=True)
 class EscalationTimeout:
     """Tracks the SLA deadline for a governance chain."""
 
@@ -402,6 +402,9 @@ def _extract_snippet(text: str, match: re.Match[str], context: int = 40) -> str:
 # Characters that are dangerous in HTML/SQL/shell contexts
 _HTML_DANGEROUS = re.compile(r"[<>&\"']")
 
+# ``$`` opening a $() or ${} shell/template expansion
+_SHELL_EXPANSION = re.compile(r"\$(?=[({])")
+
 _SANITIZE_MAP: dict[str, str] = {
     "<": "&lt;",
     ">": "&gt;",
@@ -424,8 +427,8 @@ def _neutralize(text: str) -> str:
     # Escape backticks (not covered by html.escape)
     result = result.replace("`", "&#x60;")
     # Neutralise $() and ${} shell/template patterns
-    result = re.sub(r"\$\(", "&#36;(", result)
-    result = re.sub(r"\$\{", "&#36;{", result)
+    if "$" in result:
+        result = _SHELL_EXPANSION.sub("&#36;", result)
     return result
 
 
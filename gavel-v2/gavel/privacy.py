@@ -39,7 +39,7 @@ class PrivacyCategory(str, Enum):
     PHI = "phi"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivacyFinding:
     category: PrivacyCategory
     type: str
@@ -48,7 +48,7 @@ class PrivacyFinding:
     redacted: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivacyScanResult:
     findings: list[PrivacyFinding] = field(default_factory=list)
     redacted_text: str = ""
@@ -71,7 +71,12 @@ class PrivacyScanResult:
 # Each pattern is paired with a redaction tag so downstream consumers
 # can tell what category of data was removed without seeing it.
 
-_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+# The local part is anchored to the start of its character run rather than
+# to ``\b``: with ``\b`` every word start inside a long ``a.a.a.…`` run
+# re-scanned the rest of the run, which made sandbox output quadratic.
+_EMAIL_RE = re.compile(
+    r"(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+)
 _SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
 _PHONE_RE = re.compile(
     r"(?<!\d)(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}(?!\d)"
@@ -87,6 +92,7 @@ _DOB_RE = re.compile(
     re.IGNORECASE,
 )
 _ICD10_RE = re.compile(r"\b[A-TV-Z][0-9][A-Z0-9](?:\.[A-Z0-9]{1,4})?\b")
+_ICD10_CONTEXT_RE = re.compile(r"(?i)diagnos|patient|clinical|icd")
 _MRN_RE = re.compile(
     r"\b(?:MRN|medical record number|patient id)[:\s#]*([A-Z0-9-]{4,})",
     re.IGNORECASE,
@@ -115,11 +121,17 @@ def scan_text(text: str) -> PrivacyScanResult:
         return PrivacyScanResult(redacted_text=text)
 
     findings: list[PrivacyFinding] = []
-    # We'll build the redacted text by walking replacements from last
-    # to first so offsets stay stable.
     replacements: list[tuple[int, int, str]] = []
+    # Findings with identical span/type (e.g. phone vs SSN overlap) are
+    # dropped as they are hit rather than in a second pass.
+    seen: set[tuple[int, int, str]] = set()
 
     def _hit(cat: PrivacyCategory, type_: str, m: re.Match, redaction: str) -> None:
+        replacements.append((m.start(), m.end(), redaction))
+        key = (m.start(), m.end(), type_)
+        if key in seen:
+            return
+        seen.add(key)
         findings.append(
             PrivacyFinding(
                 category=cat,
@@ -129,7 +141,6 @@ def scan_text(text: str) -> PrivacyScanResult:
                 redacted=True,
             )
         )
-        replacements.append((m.start(), m.end(), redaction))
 
     for m in _EMAIL_RE.finditer(text):
         _hit(PrivacyCategory.PII, "email", m, "[REDACTED:EMAIL]")
@@ -148,23 +159,33 @@ def scan_text(text: str) -> PrivacyScanResult:
         _hit(PrivacyCategory.PHI, "mrn", m, "[REDACTED:MRN]")
     # ICD-10 is noisy; only flag when the surrounding text mentions
     # diagnosis / patient / clinical context.
-    if re.search(r"(?i)diagnos|patient|clinical|icd", text):
+    if _ICD10_CONTEXT_RE.search(text):
         for m in _ICD10_RE.finditer(text):
             _hit(PrivacyCategory.PHI, "icd10", m, "[REDACTED:ICD10]")
 
+    return PrivacyScanResult(findings=findings, redacted_text=_redact(text, replacements))
+
+
+def _redact(text: str, replacements: list[tuple[int, int, str]]) -> str:
+    """Apply ``(start, end, tag)`` replacements to *text*.
+
+    Disjoint spans (the normal case) are stitched together in one join.
+    Overlapping spans keep the original right-to-left splice so their
+    output is unchanged; that path re-copies the text once per span.
+    """
+    ordered = sorted(replacements, key=lambda r: r[0])
+    if all(prev[1] <= cur[0] for prev, cur in zip(ordered, ordered[1:])):
+        parts: list[str] = []
+        pos = 0
+        for start, end, tag in ordered:
+            parts.append(text[pos:start])
+            parts.append(tag)
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
+
     # Apply replacements right-to-left so earlier offsets remain valid.
     redacted = text
     for start, end, tag in sorted(replacements, key=lambda r: r[0], reverse=True):
         redacted = redacted[:start] + tag + redacted[end:]
-
-    # Dedupe findings with identical span/type (e.g. phone vs SSN overlap).
-    seen: set[tuple[int, int, str]] = set()
-    unique: list[PrivacyFinding] = []
-    for f in findings:
-        key = (f.span[0], f.span[1], f.type)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(f)
-
-    return PrivacyScanResult(findings=unique, redacted_text=redacted)
+    return redacted
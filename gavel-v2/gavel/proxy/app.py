@@ -39,11 +39,11 @@ from __future__ import annotations
 import argparse
 import asyncio
 import hashlib
-import json
 import logging
 import re
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
 
 import httpx
@@ -79,6 +79,18 @@ log = logging.getLogger("gavel.proxy")
 # ---------------------------------------------------------------------------
 
 
+# Dangerous Docker API paths that AI agents should never access ungoverned.
+# Compiled once at import, so every app instance and forked worker shares them.
+_DOCKER_SENSITIVE_PATHS = re.compile(
+    r"^/v[\d.]+/(?:containers/\w+/exec$|containers/create$|images/create$"
+    r"|build$|volumes/create$|networks/create$|secrets/|configs/)"
+)
+
+_DOCKER_READONLY_PATHS = re.compile(
+    r"^(?:/v[\d.]+/(?:containers/json|images/json|info|version)|/_ping)$"
+)
+
+
 def _should_use_tls(host: str) -> bool:
     """Determine whether to use HTTPS for the upstream connection."""
     host_lower = host.lower()
@@ -87,6 +99,15 @@ def _should_use_tls(host: str) -> bool:
     return True
 
 
+def _cookieless_jar() -> CookieJar:
+    """Cookie jar that refuses every cookie.
+
+    The pooled clients are shared by all agents, so a ``Set-Cookie`` from
+    one agent's upstream must never be replayed on another agent's request.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
 def _extract_token_id(token: str | None) -> str:
     """Extract a short identifier from a token for logging (never log full token)."""
     if not token:
@@ -107,13 +128,31 @@ def create_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
     matcher = DomainMatcher(cfg.effective_domains())
     ledger = EnforcementLedger(path=cfg.ledger_path)
     validator = TokenValidator(cfg)
+    # One keepalive pool to upstream APIs, reused across forwarded requests
+    # instead of a fresh client + TCP/TLS handshake per proxied call.
+    upstream_client: httpx.AsyncClient | None = None
+
+    def _get_upstream_client() -> httpx.AsyncClient:
+        nonlocal upstream_client
+        if upstream_client is None or upstream_client.is_closed:
+            upstream_client = httpx.AsyncClient(
+                cookies=_cookieless_jar(),
+                timeout=30.0,
+                follow_redirects=True,
+                verify=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return upstream_client
 
     @asynccontextmanager
     async def lifespan(app_instance: FastAPI):
         mode = "DEFAULT-DENY" if cfg.default_deny else "DEFAULT-ALLOW (AI domains enforced)"
         log.info("Gavel Enforcement Proxy starting on :%d -- mode: %s", cfg.port, mode)
         yield
+        if upstream_client is not None and not upstream_client.is_closed:
+            await upstream_client.aclose()
         await validator.close()
+        ledger.close()
         log.info("Gavel Enforcement Proxy shut down.")
 
     app = FastAPI(
@@ -147,22 +186,7 @@ def create_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
 
     @app.get("/api/v1/ledger/stats")
     async def ledger_stats() -> dict:
-        allowed = 0
-        blocked = 0
-        if ledger._path.exists():
-            with open(ledger._path, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        if data.get("action") == "ALLOWED":
-                            allowed += 1
-                        elif data.get("action") == "BLOCKED":
-                            blocked += 1
-                    except (json.JSONDecodeError, KeyError):
-                        pass  # Malformed ledger line — skip
+        allowed, blocked = ledger.action_counts()
         return {
             "total": allowed + blocked,
             "allowed": allowed,
@@ -256,32 +280,29 @@ def create_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
 
         body = await request.body()
 
-        async with httpx.AsyncClient(
-            timeout=30.0, follow_redirects=True, verify=True
-        ) as client:
-            try:
-                upstream_resp = await client.request(
-                    method=request.method,
-                    url=url,
-                    headers=headers,
-                    content=body if body else None,
-                )
-            except httpx.ConnectError:
-                return JSONResponse(
-                    status_code=502,
-                    content={
-                        "error": "upstream_unreachable",
-                        "message": f"Could not connect to {target_host}",
-                    },
-                )
-            except httpx.TimeoutException:
-                return JSONResponse(
-                    status_code=504,
-                    content={
-                        "error": "upstream_timeout",
-                        "message": f"Upstream {target_host} timed out",
-                    },
-                )
+        try:
+            upstream_resp = await _get_upstream_client().request(
+                method=request.method,
+                url=url,
+                headers=headers,
+                content=body if body else None,
+            )
+        except httpx.ConnectError:
+            return JSONResponse(
+                status_code=502,
+                content={
+                    "error": "upstream_unreachable",
+                    "message": f"Could not connect to {target_host}",
+                },
+            )
+        except httpx.TimeoutException:
+            return JSONResponse(
+                status_code=504,
+                content={
+                    "error": "upstream_timeout",
+                    "message": f"Upstream {target_host} timed out",
+                },
+            )
 
         response_headers = dict(upstream_resp.headers)
         for hop in ("transfer-encoding", "connection", "keep-alive"):
@@ -315,26 +336,19 @@ def create_docker_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
         path=cfg.ledger_path.parent / "docker_enforcement_ledger.jsonl"
     )
     validator = TokenValidator(cfg)
-
-    # Dangerous Docker API paths that AI agents should never access ungoverned
-    SENSITIVE_PATHS = [
-        re.compile(r"^/v[\d.]+/containers/\w+/exec$"),
-        re.compile(r"^/v[\d.]+/containers/create$"),
-        re.compile(r"^/v[\d.]+/images/create$"),
-        re.compile(r"^/v[\d.]+/build$"),
-        re.compile(r"^/v[\d.]+/volumes/create$"),
-        re.compile(r"^/v[\d.]+/networks/create$"),
-        re.compile(r"^/v[\d.]+/secrets/"),
-        re.compile(r"^/v[\d.]+/configs/"),
-    ]
-
-    READONLY_PATHS = [
-        re.compile(r"^/v[\d.]+/containers/json$"),
-        re.compile(r"^/v[\d.]+/images/json$"),
-        re.compile(r"^/v[\d.]+/info$"),
-        re.compile(r"^/v[\d.]+/version$"),
-        re.compile(r"^/_ping$"),
-    ]
+    # One keepalive connection pool to dockerd, reused across requests
+    # instead of a fresh transport + socket connect per proxied call.
+    socket_client: httpx.AsyncClient | None = None
+
+    def _get_socket_client() -> httpx.AsyncClient:
+        nonlocal socket_client
+        if socket_client is None or socket_client.is_closed:
+            socket_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=docker_socket),
+                cookies=_cookieless_jar(),
+                timeout=30.0,
+            )
+        return socket_client
 
     @asynccontextmanager
     async def lifespan(app_instance: FastAPI):
@@ -344,7 +358,10 @@ def create_docker_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
             cfg.docker_port, docker_socket, socket_exists,
         )
         yield
+        if socket_client is not None and not socket_client.is_closed:
+            await socket_client.aclose()
         await validator.close()
+        ledger.close()
 
     app = FastAPI(
         title="Gavel Docker Socket Proxy",
@@ -372,9 +389,10 @@ def create_docker_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
         """Proxy Docker API requests through the Unix socket with enforcement."""
         request_path = f"/{path}"
 
-        is_sensitive = any(p.match(request_path) for p in SENSITIVE_PATHS)
-        is_readonly = any(p.match(request_path) for p in READONLY_PATHS)
-        requires_token = is_sensitive or (not is_readonly and request.method != "GET")
+        is_sensitive = _DOCKER_SENSITIVE_PATHS.match(request_path) is not None
+        requires_token = is_sensitive or (
+            request.method != "GET" and not _DOCKER_READONLY_PATHS.match(request_path)
+        )
 
         if not requires_token:
             return await _forward_to_socket(request, request_path)
@@ -431,23 +449,21 @@ def create_docker_proxy_app(config: ProxyConfig | None = None) -> FastAPI:
 
         body = await request.body()
 
-        transport = httpx.AsyncHTTPTransport(uds=docker_socket)
-        async with httpx.AsyncClient(transport=transport, timeout=30.0) as client:
-            try:
-                resp = await client.request(
-                    method=request.method,
-                    url=url,
-                    headers=headers,
-                    content=body if body else None,
-                )
-            except (httpx.ConnectError, FileNotFoundError):
-                return JSONResponse(
-                    status_code=502,
-                    content={
-                        "error": "docker_socket_unreachable",
-                        "message": f"Cannot connect to Docker socket at {docker_socket}",
-                    },
-                )
+        try:
+            resp = await _get_socket_client().request(
+                method=request.method,
+                url=url,
+                headers=headers,
+                content=body if body else None,
+            )
+        except (httpx.ConnectError, FileNotFoundError):
+            return JSONResponse(
+                status_code=502,
+                content={
+                    "error": "docker_socket_unreachable",
+                    "message": f"Cannot connect to Docker socket at {docker_socket}",
+                },
+            )
 
         response_headers = dict(resp.headers)
         for hop in ("transfer-encoding", "connection"):
@@ -20,9 +20,20 @@ class DomainMatcher:
     def __init__(self, domains: list[DomainEntry] | None = None):
         self._domains = domains or _default_ai_domains()
         self._compiled: list[tuple[re.Pattern, str]] = []
-        for entry in self._domains:
+        # Wildcard-free ASCII patterns are plain case-insensitive equality,
+        # so they are answered by a dict lookup; only the rest need a regex.
+        # The index keeps first-configured-wins ordering across both.
+        self._exact: dict[str, tuple[int, str]] = {}
+        self._globs: list[tuple[int, re.Pattern, str]] = []
+        for index, entry in enumerate(self._domains):
             regex = self._glob_to_regex(entry.pattern)
-            self._compiled.append((re.compile(regex, re.IGNORECASE), entry.label or entry.pattern))
+            compiled = re.compile(regex, re.IGNORECASE)
+            label = entry.label or entry.pattern
+            self._compiled.append((compiled, label))
+            if "*" not in entry.pattern and entry.pattern.isascii():
+                self._exact.setdefault(entry.pattern.lower(), (index, label))
+            else:
+                self._globs.append((index, compiled, label))
 
     @staticmethod
     def _glob_to_regex(glob: str) -> str:
@@ -33,9 +44,26 @@ class DomainMatcher:
     def match(self, host: str) -> tuple[bool, str]:
         """Returns ``(is_ai_domain, label)`` for a given host string."""
         host_no_port = host.split(":")[0] if ":" in host else host
-        for pattern, label in self._compiled:
+        if not host.isascii() or "\n" in host:
+            # Non-ASCII case folding and ``$`` before a trailing newline
+            # only behave like the regexes when the regexes run.
+            for pattern, label in self._compiled:
+                if pattern.match(host) or pattern.match(host_no_port):
+                    return True, label
+            return False, ""
+
+        exact = self._exact.get(host.lower())
+        bare = self._exact.get(host_no_port.lower())
+        if exact is None or (bare is not None and bare[0] < exact[0]):
+            exact = bare
+        limit = exact[0] if exact is not None else len(self._compiled)
+        for index, pattern, label in self._globs:
+            if index > limit:
+                break
             if pattern.match(host) or pattern.match(host_no_port):
                 return True, label
+        if exact is not None:
+            return True, exact[1]
         return False, ""
 
     @classmethod
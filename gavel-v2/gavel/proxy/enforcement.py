@@ -13,6 +13,7 @@ import logging
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import TextIO
 
 from pydantic import BaseModel, Field
 
@@ -72,6 +73,11 @@ class EnforcementLedger:
         self._path = path or Path("enforcement_ledger.jsonl")
         self._last_hash: str = "genesis"
         self._lock = asyncio.Lock()
+        # (allowed, blocked, bytes counted, inode) for action_counts().
+        self._counts: tuple[int, int, int, int] = (0, 0, 0, 0)
+        # Append handle kept open across entries, and the inode it points at.
+        self._fh: TextIO | None = None
+        self._fh_ino: int = 0
         self._restore_chain_tip()
 
     def _restore_chain_tip(self) -> None:
@@ -79,16 +85,11 @@ class EnforcementLedger:
         if not self._path.exists():
             return
         try:
-            with open(self._path, "r", encoding="utf-8") as fh:
-                last_line = ""
-                for line in fh:
-                    stripped = line.strip()
-                    if stripped:
-                        last_line = stripped
-                if last_line:
-                    data = json.loads(last_line)
-                    self._last_hash = data.get("entry_hash", "genesis")
-        except (OSError, json.JSONDecodeError, KeyError):
+            last_line = _last_nonblank_line(self._path)
+            if last_line:
+                data = json.loads(last_line)
+                self._last_hash = data.get("entry_hash", "genesis")
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError, KeyError):
             log.warning("Could not restore ledger chain tip; starting fresh chain.")
 
     async def append(self, entry: LedgerEntry) -> LedgerEntry:
@@ -97,8 +98,9 @@ class EnforcementLedger:
             entry.entry_hash = entry.compute_hash(self._last_hash)
             self._last_hash = entry.entry_hash
 
-            with open(self._path, "a", encoding="utf-8") as fh:
-                fh.write(entry.model_dump_json() + "\n")
+            fh = self._writer()
+            fh.write(entry.model_dump_json() + "\n")
+            fh.flush()
 
             log.info(
                 "LEDGER %s | %s %s%s | agent=%s token=%s reason=%s hash=%s",
@@ -113,6 +115,29 @@ class EnforcementLedger:
             )
             return entry
 
+    def _writer(self) -> TextIO:
+        """Return the append handle, reopening it if the file was rotated.
+
+        Like ``logging.handlers.WatchedFileHandler``: a stat per entry is
+        far cheaper than an open/close, and every line is still flushed to
+        the OS before ``append`` returns.
+        """
+        try:
+            ino = self._path.stat().st_ino
+        except FileNotFoundError:
+            ino = 0
+        if self._fh is None or ino != self._fh_ino:
+            self.close()
+            self._fh = open(self._path, "a", encoding="utf-8")
+            self._fh_ino = self._path.stat().st_ino
+        return self._fh
+
+    def close(self) -> None:
+        """Release the append handle; the next ``append`` reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
     async def verify_integrity(self) -> tuple[bool, int, list[str]]:
         """Walk the full ledger and verify every hash link."""
         if not self._path.exists():
@@ -144,3 +169,68 @@ class EnforcementLedger:
                 except (json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
                     errors.append(f"Line {lineno}: parse error -- {exc}")
         return len(errors) == 0, count, errors
+
+    def action_counts(self) -> tuple[int, int]:
+        """Return ``(allowed, blocked)`` totals for the ledger file.
+
+        The ledger is append-only, so totals are cached together with the
+        byte offset they cover and only lines written since are parsed. A
+        file that shrank or was replaced is recounted from the start.
+        """
+        try:
+            st = self._path.stat()
+        except FileNotFoundError:
+            return 0, 0
+        allowed, blocked, offset, inode = self._counts
+        if inode != st.st_ino or st.st_size < offset:
+            allowed = blocked = offset = 0
+        pending = (0, 0)
+        if st.st_size > offset:
+            with open(self._path, "rb") as fh:
+                fh.seek(offset)
+                for raw in fh:
+                    action = _ledger_action(raw)
+                    if not raw.endswith(b"\n"):
+                        # Unterminated tail: count it, but re-read next time.
+                        pending = (action == "ALLOWED", action == "BLOCKED")
+                        break
+                    offset += len(raw)
+                    if action == "ALLOWED":
+                        allowed += 1
+                    elif action == "BLOCKED":
+                        blocked += 1
+        self._counts = (allowed, blocked, offset, st.st_ino)
+        return allowed + pending[0], blocked + pending[1]
+
+
+def _last_nonblank_line(path: Path, block: int = 8192) -> bytes:
+    """The last non-blank line of *path*, stripped, read backwards from EOF.
+
+    Startup only needs the chain tip, so this reads the final block(s)
+    instead of walking every line of a ledger that grows without bound.
+    """
+    with open(path, "rb") as fh:
+        pos = fh.seek(0, 2)
+        tail = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            fh.seek(pos)
+            tail = fh.read(step) + tail
+            stripped = tail.rstrip()
+            nl = stripped.rfind(b"\n")
+            if nl != -1:
+                return stripped[nl + 1:].strip()
+        return tail.strip()
+
+
+def _ledger_action(raw: bytes) -> str:
+    """The ``action`` of one ledger line, or ``""`` if it is blank or malformed."""
+    raw = raw.strip()
+    if not raw:
+        return ""
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return ""  # Malformed ledger line — skip
+    return data.get("action", "") if isinstance(data, dict) else ""
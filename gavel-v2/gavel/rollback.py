@@ -20,6 +20,20 @@ Design:
   returns a CompensatingAction describing what was rolled back, rather
   than mutating the snapshot.
 
+- Per-file hashing fans out over a thread pool once the scope holds
+  enough files to pay for it. ``hashlib`` releases the GIL while
+  digesting, so threads scale across cores without process fork cost.
+
+- Streamed file digests are memoized on ``(st_ino, st_size,
+  st_mtime_ns, st_ctime_ns)`` taken with ``fstat`` on the open handle,
+  so a warm snapshot costs an open and an ``fstat`` per file. The key is only a
+  heuristic: timestamps are as coarse as the filesystem, and a
+  same-size rewrite inside one tick keeps it unchanged. So, as git
+  does for "racy" index entries, a digest is not cached while the
+  file's mtime/ctime is within ``_RACY_WINDOW_NS`` of now, or if the
+  key moved while the file was being read. ``verify_untouched`` is a
+  drift check and always re-reads the bytes.
+
 - Nothing here is Docker-specific. The blast box can call into this
   module regardless of the underlying execution ring.
 
@@ -34,6 +48,11 @@ Failure modes we accept:
 from __future__ import annotations
 
 import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -44,6 +63,15 @@ from pydantic import BaseModel, Field
 # ── Snapshot primitives ────────────────────────────────────────
 
 _DEFAULT_MAX_BYTES = 256 * 1024  # 256 KiB per-file cap for full capture
+_PARALLEL_MIN_FILES = 16  # below this, thread pool overhead beats the win
+_HASH_CACHE_MAX = 4096
+# Digests of files touched this recently are not cached. 2 s is FAT's mtime
+# granularity, the coarsest in common use (ext3 and HFS+ use 1 s).
+_RACY_WINDOW_NS = 2_000_000_000
+
+_StatKey = tuple[int, int, int, int]
+_HASH_CACHE: OrderedDict[str, tuple[_StatKey, str]] = OrderedDict()
+_HASH_CACHE_LOCK = threading.Lock()
 
 
 class FileSnapshot(BaseModel):
@@ -109,6 +137,42 @@ def _hash_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def _stat_key(st: os.stat_result) -> _StatKey:
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _hash_file(path: Path, use_cache: bool = True) -> str:
+    """Stream-hash a file, reusing the cached digest if its stat is unchanged.
+
+    ``use_cache=False`` always reads the bytes and leaves the cache alone.
+    """
+    cache_key = str(path)
+    with path.open("rb") as f:
+        if not use_cache:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        key = _stat_key(os.fstat(f.fileno()))
+        with _HASH_CACHE_LOCK:
+            cached = _HASH_CACHE.get(cache_key)
+            if cached is not None and cached[0] == key:
+                _HASH_CACHE.move_to_end(cache_key)
+                return cached[1]
+
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+        after = _stat_key(os.fstat(f.fileno()))
+
+    racy = time.time_ns() - max(key[2], key[3]) < _RACY_WINDOW_NS
+    if racy or after != key:
+        return digest
+
+    with _HASH_CACHE_LOCK:
+        _HASH_CACHE[cache_key] = (key, digest)
+        _HASH_CACHE.move_to_end(cache_key)
+        while len(_HASH_CACHE) > _HASH_CACHE_MAX:
+            _HASH_CACHE.popitem(last=False)
+    return digest
+
+
 def _iter_scope(scope_paths: list[str], root: Path) -> list[Path]:
     """Enumerate files under every declared scope path.
 
@@ -149,51 +213,54 @@ class Snapshotter:
         root: Path | str = ".",
     ) -> SnapshotManifest:
         """Capture a manifest for the declared scope paths."""
-        import base64
-
         root_path = Path(root).resolve()
         snap_id = f"snap-{chain_id}-{int(datetime.now(timezone.utc).timestamp())}"
         manifest = SnapshotManifest(chain_id=chain_id, snapshot_id=snap_id)
 
-        for file_path in _iter_scope(scope_paths, root_path):
-            try:
-                size = file_path.stat().st_size
-            except OSError:
-                continue
+        files = _iter_scope(scope_paths, root_path)
+        if len(files) >= _PARALLEL_MIN_FILES:
+            workers = min(len(files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                snaps = list(pool.map(lambda fp: self._capture(fp, root_path), files))
+        else:
+            snaps = [self._capture(fp, root_path) for fp in files]
 
-            rel = str(file_path.relative_to(root_path)) if file_path.is_absolute() else str(file_path)
-
-            if size <= self._max_bytes:
-                data = file_path.read_bytes()
-                snap = FileSnapshot(
-                    path=rel,
-                    sha256=_hash_bytes(data),
-                    size=size,
-                    content_b64=base64.b64encode(data).decode("ascii"),
-                    captured_full=True,
-                )
-            else:
-                # Streamed hash for oversize files
-                h = hashlib.sha256()
-                with file_path.open("rb") as f:
-                    while True:
-                        chunk = f.read(65536)
-                        if not chunk:
-                            break
-                        h.update(chunk)
-                snap = FileSnapshot(
-                    path=rel,
-                    sha256=h.hexdigest(),
-                    size=size,
-                    content_b64=None,
-                    captured_full=False,
-                )
-
-            manifest.files[rel] = snap
+        for snap in snaps:
+            if snap is not None:
+                manifest.files[snap.path] = snap
 
         self._manifests[chain_id] = manifest
         return manifest
 
+    def _capture(self, file_path: Path, root_path: Path) -> Optional[FileSnapshot]:
+        """Snapshot one file; ``None`` if it vanished or is unreadable."""
+        import base64
+
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return None
+
+        rel = str(file_path.relative_to(root_path)) if file_path.is_absolute() else str(file_path)
+
+        if size <= self._max_bytes:
+            data = file_path.read_bytes()
+            return FileSnapshot(
+                path=rel,
+                sha256=_hash_bytes(data),
+                size=size,
+                content_b64=base64.b64encode(data).decode("ascii"),
+                captured_full=True,
+            )
+        # Streamed hash for oversize files
+        return FileSnapshot(
+            path=rel,
+            sha256=_hash_file(file_path),
+            size=size,
+            content_b64=None,
+            captured_full=False,
+        )
+
     def get(self, chain_id: str) -> Optional[SnapshotManifest]:
         return self._manifests.get(chain_id)
 
@@ -305,7 +372,12 @@ class Snapshotter:
         )
 
     def verify_untouched(self, chain_id: str, root: Path | str = ".") -> list[str]:
-        """Return paths that have changed since the snapshot was taken."""
+        """Return paths that have changed since the snapshot was taken.
+
+        A single ``stat`` settles deleted and resized files; only files
+        whose size still matches the snapshot are re-hashed. The digest
+        cache is bypassed so a stale entry cannot report a file untouched.
+        """
         manifest = self._manifests.get(chain_id)
         if manifest is None:
             return []
@@ -314,14 +386,14 @@ class Snapshotter:
         drifted: list[str] = []
         for path, snap in manifest.files.items():
             full = (root_path / path).resolve()
-            if not full.exists():
-                drifted.append(path)
-                continue
             try:
-                data = full.read_bytes()
+                if full.stat().st_size != snap.size:
+                    drifted.append(path)
+                    continue
+                digest = _hash_file(full, use_cache=False)
             except OSError:
                 drifted.append(path)
                 continue
-            if _hash_bytes(data) != snap.sha256:
+            if digest != snap.sha256:
                 drifted.append(path)
         return drifted
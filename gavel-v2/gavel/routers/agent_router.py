@@ -10,7 +10,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
-from gavel.agents import AgentRegistry, AgentStatus
+from gavel.agents import AgentRecord, AgentRegistry, AgentStatus
 from gavel.chain import EventType
 from gavel.dependencies import (
     ChainLockManager,
@@ -224,12 +224,12 @@ async def approve_enrollment(
     return {"agent_id": agent_id, "status": record.status.value, "reviewed_by": reviewed_by}
 
 
-@agent_router.get("/agents")
+@agent_router.get("/agents", response_model=list[AgentRecord])
 async def list_agents(
     agent_registry: AgentRegistry = Depends(get_agent_registry),
 ):
     """List all registered agents with current status."""
-    return [a.model_dump(mode="json") for a in await agent_registry.get_all()]
+    return await agent_registry.get_all()
 
 
 @agent_router.get("/agents/{agent_id}")
@@ -5,11 +5,13 @@ Extracted from gateway.py as part of the router decomposition.
 
 from __future__ import annotations
 
-import uuid
+import logging
+import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from gavel.blastbox import BlastBox, ScopeDeclaration
@@ -51,6 +53,9 @@ from gavel.enrollment import GovernanceToken
 # self-contained.
 BLOCKED_PATTERNS = ["rm -rf", "drop table", "delete from", "format c:", "truncate", "shutdown"]
 
+# Upper bound on proposals accepted by one /propose/batch call.
+MAX_BATCH_PROPOSALS = 50
+
 
 # ---------------------------------------------------------------------------
 # Request/Response models
@@ -67,6 +72,28 @@ class ProposalRequest(BaseModel):
     risk_factors: dict[str, Any] = Field(default_factory=dict)
 
 
+class ProposalResponse(BaseModel):
+    chain_id: str
+    status: str
+    risk: float
+    tier: str
+    sla_remaining: float
+    timeline: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class ProposalBatchRequest(BaseModel):
+    proposals: list[ProposalRequest] = Field(min_length=1, max_length=MAX_BATCH_PROPOSALS)
+
+
+class ProposalBatchItem(BaseModel):
+    """Outcome of one batched proposal: ``result`` on success, else ``detail``."""
+
+    index: int
+    status_code: int
+    result: ProposalResponse | None = None
+    detail: Any = None
+
+
 class AttestationRequest(BaseModel):
     chain_id: str
     actor_id: str
@@ -101,12 +128,27 @@ class ExecuteResponse(BaseModel):
 # Router
 # ---------------------------------------------------------------------------
 governance_router = APIRouter(tags=["governance"])
+log = logging.getLogger("gavel.governance")
 
 
-@governance_router.post("/propose")
-async def propose(
-    req: ProposalRequest,
-    token: GovernanceToken = Depends(require_gavel_token),
+@dataclass(slots=True)
+class _ProposalServices:
+    """Everything a proposal needs to start a chain, resolved once per request."""
+
+    chain_repo: ChainRepository
+    evidence_repo: EvidenceRepository
+    review_repo: ReviewRepository
+    chain_locks: ChainLockManager
+    separation: SeparationOfPowers
+    tier_policy: TierPolicy
+    liveness: LivenessMonitor
+    blastbox: BlastBox
+    evidence_reviewer: EvidenceReviewer
+    event_bus: EventBus
+    mesh_client_factory: Any
+
+
+def _proposal_services(
     chain_repo: ChainRepository = Depends(get_chain_repo),
     evidence_repo: EvidenceRepository = Depends(get_evidence_repo),
     review_repo: ReviewRepository = Depends(get_review_repo),
@@ -118,31 +160,69 @@ async def propose(
     evidence_reviewer: EvidenceReviewer = Depends(get_evidence_reviewer),
     event_bus: EventBus = Depends(get_event_bus),
     mesh_client_factory=Depends(get_mesh_client_factory),
+) -> _ProposalServices:
+    return _ProposalServices(
+        chain_repo=chain_repo,
+        evidence_repo=evidence_repo,
+        review_repo=review_repo,
+        chain_locks=chain_locks,
+        separation=separation,
+        tier_policy=tier_policy,
+        liveness=liveness,
+        blastbox=blastbox,
+        evidence_reviewer=evidence_reviewer,
+        event_bus=event_bus,
+        mesh_client_factory=mesh_client_factory,
+    )
+
+
+def _check_blocked_commands(allow_commands: list[str]) -> None:
+    """Agent OS policy check: refuse scopes that allow a blocked command."""
+    for cmd in allow_commands:
+        lowered = cmd.lower()
+        for pattern in BLOCKED_PATTERNS:
+            if pattern in lowered:
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Agent OS policy violation: command '{cmd}' matches blocked pattern '{pattern}'",
+                )
+
+
+@governance_router.post("/propose", response_model=ProposalResponse)
+async def propose(
+    req: ProposalRequest,
+    background_tasks: BackgroundTasks,
+    token: GovernanceToken = Depends(require_gavel_token),
+    services: _ProposalServices = Depends(_proposal_services),
 ):
     """Submit a governance proposal. This starts a new chain."""
+    # --- Microsoft Layer: Policy violation check via Agent OS ---
+    _check_blocked_commands(req.scope.get("allow_commands", []))
+    return await _start_chain(req, background_tasks, services)
+
+
+async def _start_chain(
+    req: ProposalRequest,
+    background_tasks: BackgroundTasks,
+    services: _ProposalServices,
+) -> ProposalResponse:
+    """Run one policy-checked proposal through to a persisted chain."""
     chain = GovernanceChain()
 
     # --- Microsoft Layer: Identity verification via Agent Mesh ---
-    mesh_client = mesh_client_factory(req.actor_id)
+    mesh_client = services.mesh_client_factory(req.actor_id)
     agent_identity = mesh_client.identity
     agent_trust = mesh_client.trust_score
 
-    # --- Microsoft Layer: Policy violation check via Agent OS ---
-    for cmd in req.scope.get("allow_commands", []):
-        for pattern in BLOCKED_PATTERNS:
-            if pattern in cmd.lower():
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Agent OS policy violation: command '{cmd}' matches blocked pattern '{pattern}'",
-                )
+    allow_commands = req.scope.get("allow_commands", [])
 
     # --- Gavel Layer: Separation of powers ---
     try:
-        separation.assign(req.actor_id, ChainRole.PROPOSER, chain.chain_id)
+        services.separation.assign(req.actor_id, ChainRole.PROPOSER, chain.chain_id)
     except SeparationViolation as e:
         raise HTTPException(status_code=403, detail=str(e))
 
-    async with chain_locks.lock(chain.chain_id):
+    async with services.chain_locks.lock(chain.chain_id):
         intent_event = chain.append(
             event_type=EventType.INBOUND_INTENT,
             actor_id=req.actor_id,
@@ -166,7 +246,7 @@ async def propose(
             touches_pii=req.risk_factors.get("pii", False),
         )
 
-        tier, requirements, risk = tier_policy.evaluate(factors)
+        tier, requirements, risk = services.tier_policy.evaluate(factors)
 
         policy_event = chain.append(
             event_type=EventType.POLICY_EVAL,
@@ -188,22 +268,22 @@ async def propose(
             },
         )
 
-        sla_timeout = liveness.track(chain.chain_id, requirements.sla_seconds)
+        sla_timeout = services.liveness.track(chain.chain_id, requirements.sla_seconds)
 
         if requirements.requires_blast_box:
             scope = ScopeDeclaration(
                 allow_paths=req.scope.get("allow_paths", []),
-                allow_commands=req.scope.get("allow_commands", []),
+                allow_commands=allow_commands,
                 allow_network=req.scope.get("allow_network", False),
             )
 
-            packet = await blastbox.execute(
+            packet = await services.blastbox.execute(
                 chain_id=chain.chain_id,
                 intent_event_id=intent_event.event_id,
-                command_argv=req.scope.get("allow_commands", []),
+                command_argv=allow_commands,
                 scope=scope,
             )
-            await evidence_repo.save(chain.chain_id, packet)
+            await services.evidence_repo.save(chain.chain_id, packet)
 
             chain.append(
                 event_type=EventType.BLASTBOX_EVIDENCE,
@@ -218,8 +298,8 @@ async def propose(
             )
 
             if requirements.requires_evidence_review:
-                result = evidence_reviewer.review(packet, scope)
-                await review_repo.save(chain.chain_id, result)
+                result = services.evidence_reviewer.review(packet, scope)
+                await services.review_repo.save(chain.chain_id, result)
 
                 chain.append(
                     event_type=EventType.EVIDENCE_REVIEW,
@@ -233,7 +313,7 @@ async def propose(
                     },
                 )
 
-        current_review = await review_repo.get(chain.chain_id) or ReviewResult()
+        current_review = await services.review_repo.get(chain.chain_id) or ReviewResult()
         if tier == AutonomyTier.SEMI_AUTONOMOUS and current_review.passed:
             chain.status = ChainStatus.APPROVED
             chain.append(
@@ -242,7 +322,7 @@ async def propose(
                 role_used="system",
                 payload={"reason": "Tier 1 auto-approve: evidence review passed, risk below threshold"},
             )
-            liveness.resolve(chain.chain_id, "AUTO_APPROVED")
+            services.liveness.resolve(chain.chain_id, "AUTO_APPROVED")
         else:
             chain.status = ChainStatus.ESCALATED
             chain.append(
@@ -259,23 +339,58 @@ async def propose(
                 },
             )
 
-        await chain_repo.save(chain)
+        await services.chain_repo.save(chain)
 
-    await event_bus.publish(DashboardEvent(
+    # The chain is already persisted; the dashboard event is published
+    # after the response is sent so a slow bus never delays the caller.
+    background_tasks.add_task(services.event_bus.publish, DashboardEvent(
         event_type="chain_event",
         agent_id=req.actor_id,
         chain_id=chain.chain_id,
         payload={"status": chain.status.value, "risk": risk, "tier": tier.name},
     ))
 
-    return {
-        "chain_id": chain.chain_id,
-        "status": chain.status.value,
-        "risk": risk,
-        "tier": tier.name,
-        "sla_remaining": sla_timeout.remaining_seconds,
-        "timeline": chain.to_timeline(),
-    }
+    return ProposalResponse(
+        chain_id=chain.chain_id,
+        status=chain.status.value,
+        risk=risk,
+        tier=tier.name,
+        sla_remaining=sla_timeout.remaining_seconds,
+        timeline=chain.to_timeline(),
+    )
+
+
+@governance_router.post("/propose/batch", response_model=list[ProposalBatchItem])
+async def propose_batch(
+    batch: ProposalBatchRequest,
+    background_tasks: BackgroundTasks,
+    token: GovernanceToken = Depends(require_gavel_token),
+    services: _ProposalServices = Depends(_proposal_services),
+):
+    """Submit several proposals in one round trip. Each starts its own chain.
+
+    Every proposal's scope is policy-checked before any chain is created,
+    so a batch containing a blocked command is refused as a whole. Past
+    that check the proposals are independent and run in order: a failure
+    on one is reported in its own entry, chains started by the others stay
+    persisted, and the response carries one entry per proposal.
+    """
+    # --- Microsoft Layer: Policy violation check via Agent OS ---
+    for req in batch.proposals:
+        _check_blocked_commands(req.scope.get("allow_commands", []))
+
+    items: list[ProposalBatchItem] = []
+    for index, req in enumerate(batch.proposals):
+        try:
+            result = await _start_chain(req, background_tasks, services)
+        except HTTPException as e:
+            items.append(ProposalBatchItem(index=index, status_code=e.status_code, detail=e.detail))
+        except Exception:
+            log.exception("Batched proposal %d from %s failed", index, req.actor_id)
+            items.append(ProposalBatchItem(index=index, status_code=500, detail="Internal error"))
+        else:
+            items.append(ProposalBatchItem(index=index, status_code=200, result=result))
+    return items
 
 
 @governance_router.post("/attest")
@@ -334,7 +449,7 @@ async def approve(
     event_bus: EventBus = Depends(get_event_bus),
 ):
     """Submit an approval or denial for a chain."""
-    chain = await chain_repo.get(req.chain_id)
+    chain = await chain_repo.get(req.chain_id, use_cache=False)
     if not chain:
         raise HTTPException(status_code=404, detail="Chain not found")
 
@@ -365,7 +480,7 @@ async def approve(
             )
             liveness.resolve(req.chain_id, "APPROVED")
 
-            token_id = f"exec-t-{uuid.uuid4().hex[:8]}"
+            token_id = f"exec-t-{secrets.token_hex(4)}"
             exec_token = {
                 "token_id": token_id,
                 "chain_id": req.chain_id,
@@ -433,6 +548,8 @@ async def execute(
     event_bus: EventBus = Depends(get_event_bus),
 ):
     """Execute an approved governance action -- closing the propose->approve->execute loop."""
+    # The token is checked before the chain is loaded, so a bad token is
+    # refused without paying for the chain's event rehydration.
     token_record = await execution_token_repo.get(req.execution_token)
     if token_record is None:
         raise HTTPException(
@@ -459,7 +576,7 @@ async def execute(
             detail={"error": "token_chain_mismatch", "detail": "Execution token does not belong to this chain"},
         )
 
-    chain = await chain_repo.get(req.chain_id)
+    chain = await chain_repo.get(req.chain_id, use_cache=False)
     if chain is None:
         raise HTTPException(status_code=404, detail="Chain not found")
 
@@ -486,7 +603,7 @@ async def execute(
         )
 
     async with chain_locks.lock(req.chain_id):
-        execution_id = f"exec-{uuid.uuid4().hex[:8]}"
+        execution_id = f"exec-{secrets.token_hex(4)}"
         chain.status = ChainStatus.EXECUTING
 
         chain.append(
@@ -610,7 +727,7 @@ async def get_chain(
     separation: SeparationOfPowers = Depends(get_separation),
 ):
     """Get the full governance chain -- the complete decision trail."""
-    chain = await chain_repo.get(chain_id)
+    chain = await chain_repo.get(chain_id, use_cache=False)
     if not chain:
         raise HTTPException(status_code=404, detail="Chain not found")
 
@@ -646,7 +763,7 @@ async def get_chain_artifact(
     chain_repo: ChainRepository = Depends(get_chain_repo),
 ):
     """Export a governance chain as a portable decision artifact."""
-    chain = await chain_repo.get(chain_id)
+    chain = await chain_repo.get(chain_id, use_cache=False)
     if not chain:
         raise HTTPException(status_code=404, detail="Chain not found")
     return chain.to_artifact()
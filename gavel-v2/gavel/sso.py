@@ -21,6 +21,7 @@ Design constraints:
 from __future__ import annotations
 
 import hashlib
+import hmac
 import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -246,6 +247,7 @@ class SessionManager:
     def __init__(self, session_ttl_hours: int = 8):
         self._sessions: dict[str, AuthSession] = {}  # session_id -> session
         self._by_operator: dict[str, list[str]] = {}  # operator_id -> [session_id, ...]
+        self._by_token: dict[str, str] = {}  # session_token -> session_id
         self._session_ttl = timedelta(hours=session_ttl_hours)
 
     def create_session(self, identity: OperatorIdentity) -> AuthSession:
@@ -261,6 +263,7 @@ class SessionManager:
         )
         self._sessions[session.session_id] = session
         self._by_operator.setdefault(identity.operator_id, []).append(session.session_id)
+        self._by_token[session_token] = session.session_id
         return session
 
     def validate_session(self, session_id: str) -> AuthSession | None:
@@ -275,12 +278,17 @@ class SessionManager:
         return session
 
     def validate_session_token(self, token: str) -> AuthSession | None:
-        """Validate a session by its token string."""
-        for session in self._sessions.values():
-            if session.session_token == token and not session.revoked:
-                if datetime.now(timezone.utc) < session.expires_at:
-                    return session
-        return None
+        """Validate a session by its token string.
+
+        The token index makes this a dict lookup instead of a walk over every
+        session; the hit is still confirmed with a constant-time compare.
+        """
+        session = self._sessions.get(self._by_token.get(token, ""))
+        if session is None or not hmac.compare_digest(session.session_token, token):
+            return None
+        if session.revoked or datetime.now(timezone.utc) >= session.expires_at:
+            return None
+        return session
 
     def revoke_session(self, session_id: str) -> bool:
         session = self._sessions.get(session_id)
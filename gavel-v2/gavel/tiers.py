@@ -17,6 +17,7 @@ Tier 3: Multi-sig (multiple independent reviewers + human).
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import IntEnum
 
@@ -30,7 +31,7 @@ class AutonomyTier(IntEnum):
     CRITICAL = 3         # Multi-sig with human oversight
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierRequirements:
     """What governance controls are required at each tier."""
 
@@ -94,6 +95,15 @@ TIER_TABLE: dict[AutonomyTier, TierRequirements] = {
 }
 
 
+_TIERS_BY_VALUE: tuple[AutonomyTier, ...] = tuple(sorted(AutonomyTier))
+
+# Tiers are a dense 0..3 range, so hot paths index this tuple by tier
+# instead of hashing into TIER_TABLE. Position i holds tier i.
+TIER_REQUIREMENTS: tuple[TierRequirements, ...] = tuple(
+    TIER_TABLE[tier] for tier in _TIERS_BY_VALUE
+)
+
+
 @dataclass
 class RiskFactors:
     """Factors that contribute to risk scoring."""
@@ -125,6 +135,15 @@ class TierPolicy:
             AutonomyTier.AUTONOMOUS: 0.7,
             AutonomyTier.CRITICAL: 0.9,
         }
+        # Lower bounds for tiers 1..3 in tier order. determine_tier is a
+        # bisect over this tuple instead of an if/elif cascade.
+        self._tier_floors: tuple[float, ...] = tuple(
+            self.risk_thresholds[tier] for tier in _TIERS_BY_VALUE[1:]
+        )
+        if any(a > b for a, b in zip(self._tier_floors, self._tier_floors[1:])):
+            raise ValueError(
+                f"risk_thresholds must be non-decreasing by tier, got {self._tier_floors}"
+            )
 
     def compute_risk(self, factors: RiskFactors) -> float:
         """Compute a 0-1 risk score from factors."""
@@ -149,18 +168,14 @@ class TierPolicy:
         return max(0.0, min(1.0, risk))
 
     def determine_tier(self, risk: float) -> AutonomyTier:
-        """Map a risk score to a governance tier."""
-        if risk >= self.risk_thresholds[AutonomyTier.CRITICAL]:
-            return AutonomyTier.CRITICAL
-        elif risk >= self.risk_thresholds[AutonomyTier.AUTONOMOUS]:
-            return AutonomyTier.AUTONOMOUS
-        elif risk >= self.risk_thresholds[AutonomyTier.SEMI_AUTONOMOUS]:
-            return AutonomyTier.SEMI_AUTONOMOUS
-        else:
-            return AutonomyTier.SUPERVISED
+        """Map a risk score to a governance tier.
+
+        The highest tier whose threshold is ``<= risk`` wins.
+        """
+        return _TIERS_BY_VALUE[bisect_right(self._tier_floors, risk)]
 
     def get_requirements(self, tier: AutonomyTier) -> TierRequirements:
-        return TIER_TABLE[tier]
+        return TIER_REQUIREMENTS[tier]
 
     def evaluate(self, factors: RiskFactors) -> tuple[AutonomyTier, TierRequirements, float]:
         """
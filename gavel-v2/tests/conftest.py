@@ -3,17 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import os
-import sys
 
 import pytest
 
-# Ensure gavel package is importable
-sys.path.insert(
-    0,
-    os.path.join(os.path.dirname(__file__), ".."),
-)
-
 # Import models before anything else so Base.metadata is populated.
 from gavel.db import models as _models  # noqa: F401
 from gavel.db.base import Base
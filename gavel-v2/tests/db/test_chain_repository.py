@@ -8,11 +8,14 @@ that ever fails, the tamper seal is broken by persistence round-trip.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import update
 
 from gavel.chain import ChainStatus, EventType, GovernanceChain
+from gavel.db.models import ChainEventRow
 from gavel.db.repositories.chains import ChainRepository
 
 
@@ -98,6 +101,23 @@ async def test_save_is_idempotent(sessionmaker):
     assert loaded2.verify_integrity() is True
 
 
+async def test_save_after_empty_first_save_inserts_all_events(sessionmaker):
+    """A chain row without events reports no persisted sequence."""
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain()
+    await repo.save(chain)
+
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer", {"n": 1})
+    chain.append(EventType.POLICY_EVAL, "a:2", "evaluator", {"n": 2})
+    chain.status = ChainStatus.ESCALATED
+    await repo.save(chain)
+
+    loaded = await repo.get(chain.chain_id)
+    assert loaded is not None
+    assert loaded.status == ChainStatus.ESCALATED
+    assert [e.event_id for e in loaded.events] == [e.event_id for e in chain.events]
+
+
 async def test_append_event_hot_path(sessionmaker):
     """``append_event`` inserts a single row without rewriting the chain row."""
     repo = ChainRepository(sessionmaker)
@@ -169,6 +189,26 @@ async def test_list_stale_uses_created_at_for_empty_chain(sessionmaker):
     assert "c-empty-fresh" not in stale
 
 
+async def test_list_stale_filters_by_status(sessionmaker):
+    repo = ChainRepository(sessionmaker)
+    old = datetime.now(timezone.utc) - timedelta(hours=2)
+
+    done = GovernanceChain(chain_id="c-done")
+    done.created_at = old
+    done.status = ChainStatus.COMPLETED
+    pending = GovernanceChain(chain_id="c-pending")
+    pending.created_at = old
+    await repo.save(done)
+    await repo.save(pending)
+
+    cutoff = old + timedelta(hours=1)
+    assert set(await repo.list_stale(cutoff)) == {"c-done", "c-pending"}
+    terminal = await repo.list_stale(
+        cutoff, statuses={ChainStatus.COMPLETED, ChainStatus.DENIED},
+    )
+    assert terminal == ["c-done"]
+
+
 async def test_list_all_and_count_all(sessionmaker):
     repo = ChainRepository(sessionmaker)
     assert await repo.count_all() == 0
@@ -204,3 +244,101 @@ async def test_actor_roles_roundtrip_as_json(sessionmaker):
     # And the helper still works post-load.
     assert set(loaded.get_actors_by_role("proposer")) == {"agent:alice"}
     assert set(loaded.get_actors_by_role("reviewer")) == {"agent:bob"}
+
+
+async def test_append_events_batch(sessionmaker):
+    """``append_events`` writes several events with contiguous sequences."""
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain()
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer", {"n": 1})
+    await repo.save(chain)
+
+    batch = [
+        chain.append(EventType.POLICY_EVAL, "a:2", "evaluator", {"n": 2}),
+        chain.append(EventType.REVIEW_ATTESTATION, "a:3", "reviewer", {"n": 3}),
+    ]
+    await repo.append_events(chain.chain_id, batch)
+    await repo.append_events(chain.chain_id, [])
+
+    loaded = await repo.get(chain.chain_id)
+    assert loaded is not None
+    assert [e.event_id for e in loaded.events] == [e.event_id for e in chain.events]
+    assert loaded.verify_integrity() is True
+
+
+async def test_get_reuses_cached_events_and_fetches_new_ones(sessionmaker):
+    """Warm ``get()`` returns the cached event objects plus freshly appended rows."""
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain()
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer", {"n": 1})
+    chain.append(EventType.POLICY_EVAL, "a:2", "evaluator", {"n": 2})
+    await repo.save(chain)
+
+    first = await repo.get(chain.chain_id)
+    new_event = chain.append(EventType.REVIEW_ATTESTATION, "a:3", "reviewer", {"n": 3})
+    # A second repository instance on the same sessionmaker shares the cache.
+    other = ChainRepository(sessionmaker)
+    await other.append_event(chain.chain_id, new_event)
+
+    second = await other.get(chain.chain_id)
+    assert second is not None
+    assert second.events[0] is first.events[0]
+    assert [e.event_id for e in second.events] == [e.event_id for e in chain.events]
+    assert second.verify_integrity() is True
+
+
+async def test_get_reloads_when_cached_prefix_no_longer_matches(sessionmaker):
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain(chain_id="c-recreated")
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer", {"v": "old"})
+    await repo.save(chain)
+    assert (await repo.get(chain.chain_id)).events[0].payload == {"v": "old"}
+
+    # Recreate a chain with the same id but different history, bypassing
+    # this repository's delete() so the cache is not invalidated locally.
+    other = ChainRepository(sessionmaker)
+    other._event_cache = OrderedDict()
+    await other.delete(chain.chain_id)
+    replacement = GovernanceChain(chain_id="c-recreated")
+    replacement.append(EventType.INBOUND_INTENT, "a:9", "proposer", {"v": "new"})
+    replacement.append(EventType.POLICY_EVAL, "a:9", "evaluator", {"v": "new"})
+    await other.save(replacement)
+
+    loaded = await repo.get("c-recreated")
+    assert loaded is not None
+    assert [e.event_id for e in loaded.events] == [e.event_id for e in replacement.events]
+    assert loaded.verify_integrity() is True
+
+
+async def test_delete_evicts_cached_events(sessionmaker):
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain()
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer")
+    await repo.save(chain)
+    await repo.get(chain.chain_id)
+
+    await repo.delete(chain.chain_id)
+    assert chain.chain_id not in repo._event_cache
+
+
+async def test_uncached_get_sees_tampered_earlier_event(sessionmaker):
+    repo = ChainRepository(sessionmaker)
+    chain = GovernanceChain()
+    chain.append(EventType.INBOUND_INTENT, "a:1", "proposer", {"amount": 10})
+    chain.append(EventType.POLICY_EVAL, "a:2", "evaluator", {"ok": True})
+    await repo.save(chain)
+    assert (await repo.get(chain.chain_id)).verify_integrity() is True
+
+    # Rewrite the first stored event behind the repository's back; the
+    # last row (the cache's boundary check) is left untouched.
+    async with sessionmaker() as session:
+        await session.execute(
+            update(ChainEventRow)
+            .where(ChainEventRow.chain_id == chain.chain_id, ChainEventRow.sequence == 0)
+            .values(payload={"amount": 10_000})
+        )
+        await session.commit()
+
+    fresh = await repo.get(chain.chain_id, use_cache=False)
+    assert fresh.events[0].payload == {"amount": 10_000}
+    assert fresh.verify_integrity() is False
@@ -93,3 +93,96 @@ def test_engine_factory_sqlite_omits_pool_kwargs(monkeypatch):
     assert "pool_size" not in captured["kwargs"]
     assert "max_overflow" not in captured["kwargs"]
     assert "pool_pre_ping" not in captured["kwargs"]
+
+
+def test_engine_factory_pool_sizing_from_env(monkeypatch):
+    captured: dict = {}
+
+    def fake_create(url, **kwargs):
+        captured["kwargs"] = kwargs
+        return object()
+
+    monkeypatch.setattr(engine_mod, "create_async_engine", fake_create)
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@h/db")
+    monkeypatch.setenv("GAVEL_DB_POOL_SIZE", "8")
+    monkeypatch.setenv("GAVEL_DB_MAX_OVERFLOW", "0")
+
+    get_engine()
+
+    assert captured["kwargs"]["pool_size"] == 8
+    assert captured["kwargs"]["max_overflow"] == 0
+
+
+def test_engine_factory_rejects_bad_pool_size(monkeypatch):
+    monkeypatch.setattr(engine_mod, "create_async_engine", lambda url, **kw: object())
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@h/db")
+    monkeypatch.setenv("GAVEL_DB_POOL_SIZE", "lots")
+
+    with pytest.raises(ValueError, match="GAVEL_DB_POOL_SIZE"):
+        get_engine()
+
+
+def test_engine_factory_postgres_statement_cache_defaults(monkeypatch):
+    captured: dict = {}
+
+    def fake_create(url, **kwargs):
+        captured["kwargs"] = kwargs
+        return object()
+
+    monkeypatch.setattr(engine_mod, "create_async_engine", fake_create)
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@h/db")
+    monkeypatch.delenv("GAVEL_DB_PLAN_CACHE_MODE", raising=False)
+
+    get_engine()
+
+    assert captured["kwargs"]["connect_args"] == {"prepared_statement_cache_size": 100}
+
+
+def test_engine_factory_postgres_plan_cache_mode(monkeypatch):
+    captured: dict = {}
+
+    def fake_create(url, **kwargs):
+        captured["kwargs"] = kwargs
+        return object()
+
+    monkeypatch.setattr(engine_mod, "create_async_engine", fake_create)
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@h/db")
+    monkeypatch.setenv("GAVEL_DB_STATEMENT_CACHE_SIZE", "500")
+    monkeypatch.setenv("GAVEL_DB_PLAN_CACHE_MODE", "force_custom_plan")
+
+    get_engine()
+
+    connect_args = captured["kwargs"]["connect_args"]
+    assert connect_args["prepared_statement_cache_size"] == 500
+    assert connect_args["server_settings"] == {"plan_cache_mode": "force_custom_plan"}
+
+
+def test_engine_factory_rejects_unknown_plan_cache_mode(monkeypatch):
+    monkeypatch.setattr(engine_mod, "create_async_engine", lambda url, **kw: object())
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@h/db")
+    monkeypatch.setenv("GAVEL_DB_PLAN_CACHE_MODE", "sometimes")
+
+    with pytest.raises(ValueError, match="GAVEL_DB_PLAN_CACHE_MODE"):
+        get_engine()
+
+
+def test_engine_factory_pgbouncer_disables_statement_caches(monkeypatch):
+    captured: dict = {}
+
+    def fake_create(url, **kwargs):
+        captured["kwargs"] = kwargs
+        return object()
+
+    monkeypatch.setattr(engine_mod, "create_async_engine", fake_create)
+    monkeypatch.setenv("GAVEL_DB_URL", "postgresql+asyncpg://u:p@pgbouncer:6432/db")
+    monkeypatch.setenv("GAVEL_DB_PGBOUNCER", "1")
+    monkeypatch.setenv("GAVEL_DB_PLAN_CACHE_MODE", "force_custom_plan")
+
+    get_engine()
+
+    connect_args = captured["kwargs"]["connect_args"]
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["statement_cache_size"] == 0
+    assert "server_settings" not in connect_args
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
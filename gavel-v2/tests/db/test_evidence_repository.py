@@ -95,3 +95,20 @@ async def test_delete_missing_is_noop(sessionmaker):
     repo = EvidenceRepository(sessionmaker)
     # Must not raise.
     await repo.delete("c-never-saved")
+
+
+async def test_save_many_bulk_upsert(sessionmaker):
+    repo = EvidenceRepository(sessionmaker)
+
+    stale = _sample_packet(chain_id="c-bulk-1", exit_code=9)
+    await repo.save(stale.chain_id, stale)
+
+    packets = {cid: _sample_packet(chain_id=cid) for cid in ("c-bulk-1", "c-bulk-2", "c-bulk-3")}
+    await repo.save_many(packets)
+    await repo.save_many({})
+
+    for cid, packet in packets.items():
+        loaded = await repo.get(cid)
+        assert loaded is not None
+        assert loaded.packet_id == packet.packet_id
+        assert loaded.compute_hash() == packet.compute_hash()
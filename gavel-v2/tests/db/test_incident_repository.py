@@ -149,3 +149,17 @@ async def test_mark_resolved_is_atomic_idempotent_once(sessionmaker):
     assert loaded is not None
     assert loaded.resolved_at is not None
     assert loaded.status == IncidentStatus.RESOLVED
+
+
+async def test_overdue_predicate_uses_partial_index(sessionmaker):
+    """The overdue filter is served by the partial ``reported_at IS NULL`` index."""
+    from sqlalchemy import text
+
+    async with sessionmaker() as session:
+        result = await session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT incident_id FROM incidents "
+            "WHERE deadline IS NOT NULL AND deadline < :now "
+            "AND reported_at IS NULL"
+        ), {"now": datetime.now(timezone.utc)})
+        plan = " ".join(str(row[-1]) for row in result)
+    assert "ix_incidents_unreported_deadline" in plan
@@ -86,3 +86,13 @@ async def test_privacy_findings_roundtrip(sessionmaker):
 async def test_delete_missing_is_noop(sessionmaker):
     repo = ReviewRepository(sessionmaker)
     await repo.delete("c-never")
+
+
+def test_finding_dict_covers_every_field():
+    """The hand-rolled serializer must stay in step with ``Finding``."""
+    from dataclasses import asdict
+
+    from gavel.db.repositories.reviews import _finding_to_dict
+
+    f = Finding(check="exit_code", passed=False, detail="Exit code: 1", severity="fail")
+    assert _finding_to_dict(f) == asdict(f)
@@ -78,6 +78,19 @@ def test_artifact_hash_computation():
     assert artifact.artifact_hash == recomputed
 
 
+def test_artifact_hash_matches_one_shot_canonical_json():
+    chain = GovernanceChain()
+    for i in range(400):
+        chain.append(EventType.POLICY_EVAL, "system:evaluator", "evaluator", {"i": i})
+    artifact = from_chain(chain)
+
+    data = artifact.model_dump(mode="json")
+    data.pop("artifact_hash")
+    one_shot = json.dumps(data, sort_keys=True, default=str)
+    assert len(one_shot) > 64 * 1024
+    assert artifact.artifact_hash == hashlib.sha256(one_shot.encode()).hexdigest()
+
+
 def test_artifact_hash_tamper_detection():
     chain = _build_chain()
     artifact = from_chain(chain)
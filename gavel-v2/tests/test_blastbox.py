@@ -93,6 +93,12 @@ class TestEvidencePacket:
         assert pkt.started_at.tzinfo == timezone.utc
         assert pkt.finished_at.tzinfo == timezone.utc
 
+    def test_slotted_rejects_unknown_attributes(self):
+        pkt = EvidencePacket()
+        assert not hasattr(pkt, "__dict__")
+        with pytest.raises(AttributeError):
+            pkt.not_a_field = 1
+
 
 # ── BlastBox ──────────────────────────────────────────────────────
 
@@ -0,0 +1,61 @@
+"""Request body size limit tests: declared and streamed oversize bodies."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from gavel.body_limit import BodySizeLimitMiddleware
+
+
+class _Payload(BaseModel):
+    content: str
+
+
+def _mini_app(max_bytes: int = 64) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=max_bytes)
+
+    @app.post("/echo")
+    async def echo(payload: _Payload):
+        return {"length": len(payload.content)}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+class TestBodySizeLimit:
+    def test_small_body_passes(self):
+        client = TestClient(_mini_app())
+        r = client.post("/echo", json={"content": "hello"})
+        assert r.status_code == 200
+        assert r.json() == {"length": 5}
+
+    def test_declared_oversize_body_rejected(self):
+        client = TestClient(_mini_app())
+        r = client.post("/echo", json={"content": "x" * 200})
+        assert r.status_code == 413
+        assert "64 bytes" in r.json()["detail"]
+
+    def test_streamed_oversize_body_rejected(self):
+        client = TestClient(_mini_app())
+
+        def chunks():
+            yield b'{"content": "'
+            yield b"x" * 200
+            yield b'"}'
+
+        r = client.post(
+            "/echo",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+        assert r.status_code == 413
+
+    def test_bodyless_request_unaffected(self):
+        client = TestClient(_mini_app(max_bytes=0))
+        assert client.get("/ping").status_code == 200
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import hashlib
+import json
 
 import pytest
 
@@ -85,6 +86,29 @@ class TestChainAppend:
         recomputed = event.compute_hash()
         assert event.event_hash == recomputed
 
+    def test_event_hash_byte_format_is_stable(self, governance_chain):
+        """The canonical form must stay ``json.dumps(..., sort_keys=True)``."""
+        event = governance_chain.append(
+            event_type=EventType.INBOUND_INTENT,
+            actor_id="agent:test",
+            role_used="proposer",
+            payload={"b": [1, 2], "a": "caf\u00e9"},
+        )
+        legacy = json.dumps(
+            {
+                "event_id": event.event_id,
+                "chain_id": event.chain_id,
+                "event_type": event.event_type.value,
+                "actor_id": event.actor_id,
+                "role_used": event.role_used,
+                "timestamp": event.timestamp.isoformat(),
+                "payload": event.payload,
+                "prev_hash": event.prev_hash,
+            },
+            sort_keys=True,
+        )
+        assert event.event_hash == hashlib.sha256(legacy.encode()).hexdigest()
+
     def test_actor_role_tracking(self, governance_chain):
         governance_chain.append(
             event_type=EventType.INBOUND_INTENT,
@@ -2,14 +2,10 @@
 
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from gavel.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -141,6 +141,24 @@ class TestProhibitedPracticeDetection:
         violations = detect_prohibited_practices(app)
         assert len(violations) > 0
 
+    def test_paraphrase_caught_by_fused_pattern_family(self):
+        """No Act keyword present — only the regex family layer can match."""
+        app = _valid_application()
+        app.purpose.summary = "Scores each citizen on public conduct to decide housing eligibility"
+        violations = detect_prohibited_practices(app)
+        assert any("5(1)(c)" in v for v in violations)
+        assert classify_risk_category(app.purpose, app.capabilities) == HighRiskCategory.PROHIBITED
+
+    def test_repetitive_text_scans_in_linear_time(self):
+        """``citizen citizen …`` used to backtrack cubically through ``.*``."""
+        import time
+
+        app = _valid_application()
+        app.purpose.summary = "citizen rank " * 20_000
+        start = time.perf_counter()
+        detect_prohibited_practices(app)
+        assert time.perf_counter() - start < 2.0
+
     def test_clean_application_passes(self):
         """Normal development agent has no prohibited practices."""
         app = _valid_application()
@@ -0,0 +1,59 @@
+"""Response compression: large bodies are gzipped, SSE streams never are."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from gavel.compression import StreamSafeGZipMiddleware
+from gavel.dependencies import get_event_bus
+from gavel.events import DashboardEvent
+from gavel.gateway import app
+
+
+class _OneShotBus:
+    """Event bus whose subscription yields a single large event and ends."""
+
+    async def subscribe(self):
+        yield DashboardEvent(event_type="chain_event", payload={"blob": "x" * 4096})
+
+
+def test_event_stream_not_gzipped():
+    app.dependency_overrides[get_event_bus] = lambda: _OneShotBus()
+    try:
+        client = TestClient(app)
+        resp = client.get("/v1/events/stream", headers={"Accept-Encoding": "gzip"})
+    finally:
+        app.dependency_overrides.pop(get_event_bus, None)
+
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.text.startswith("event: chain_event\n")
+
+
+def _mini_app() -> FastAPI:
+    mini = FastAPI()
+    mini.add_middleware(StreamSafeGZipMiddleware, minimum_size=16, stream_paths=["/stream"])
+
+    @mini.get("/big")
+    async def big():
+        return {"blob": "x" * 4096}
+
+    @mini.get("/stream")
+    async def stream():
+        return {"blob": "x" * 4096}
+
+    return mini
+
+
+def test_other_large_responses_still_gzipped():
+    resp = TestClient(_mini_app()).get("/big", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json() == {"blob": "x" * 4096}
+
+
+def test_stream_paths_bypass_compressor_whatever_the_content_type():
+    # Does not rely on the installed Starlette excluding text/event-stream.
+    resp = TestClient(_mini_app()).get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+    assert resp.json() == {"blob": "x" * 4096}
@@ -129,6 +129,27 @@ def test_alembic_upgrade_head_on_empty_sqlite_creates_all_tables(tmp_path):
         sync_engine.dispose()
 
 
+def test_alembic_head_creates_model_indexes(tmp_path):
+    """Every index declared on the ORM models exists after ``upgrade head``."""
+    db_path = tmp_path / "alembic_indexes.db"
+    url = f"sqlite+aiosqlite:///{db_path.as_posix()}"
+
+    _run_alembic_upgrade(url)
+
+    from sqlalchemy import create_engine
+
+    sync_engine = create_engine(url.replace("sqlite+aiosqlite", "sqlite"))
+    try:
+        insp = inspect(sync_engine)
+        for table in Base.metadata.sorted_tables:
+            declared = {ix.name for ix in table.indexes}
+            present = {ix["name"] for ix in insp.get_indexes(table.name)}
+            missing = declared - present
+            assert not missing, f"{table.name}: indexes missing after upgrade: {missing}"
+    finally:
+        sync_engine.dispose()
+
+
 # ── ORM roundtrip ─────────────────────────────────────────────────
 
 
@@ -367,3 +367,21 @@ class TestEdgeCases:
         assert DeceptionSignal.SELECTIVE_DISCLOSURE.value == "selective_disclosure"
         assert DeceptionSignal.IDENTITY_MISREPRESENTATION.value == "identity_misrepresentation"
         assert DeceptionSignal.HALLUCINATED_CAPABILITIES.value == "hallucinated_capabilities"
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "The deploy finished without errors.",
+        "This is 100% certain and I am a human.",
+        "I can browse the web and this never fails.",
+        "As a lawyer I have the authority to sign.",
+    ])
+    def test_fused_prefilters_agree_with_pattern_libraries(self, text: str) -> None:
+        from gavel import deception
+
+        for library, fused in (
+            (deception._OVERCONFIDENCE_PATTERNS, deception._OVERCONFIDENCE_ANY),
+            (deception._IDENTITY_PATTERNS, deception._IDENTITY_ANY),
+            (deception._CAPABILITY_CLAIMS, deception._CAPABILITY_ANY),
+        ):
+            expected = any(entry[0].search(text) for entry in library)
+            assert bool(fused.search(text)) is expected
@@ -94,3 +94,24 @@ def test_real_registry_restored_after_override_removed():
     resp = client.get("/v1/agents/sentinel-only")
     assert resp.status_code == 404
     assert fake.calls == []
+
+
+def test_repositories_do_not_pin_replaced_sessionmakers():
+    import gc
+    import weakref
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from gavel.dependencies import get_chain_repo
+
+    first_sm = async_sessionmaker()
+    first = get_chain_repo(first_sm)
+    assert get_chain_repo(first_sm) is first
+
+    first_ref = weakref.ref(first_sm)
+    second_sm = async_sessionmaker()
+    assert get_chain_repo(second_sm) is not first
+
+    del first, first_sm
+    gc.collect()
+    assert first_ref() is None
@@ -0,0 +1,28 @@
+"""/v1/execute: execution tokens are checked before the chain is loaded."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from gavel.db.repositories import ChainRepository
+from gavel.gateway import app
+
+
+def test_unknown_token_rejected_without_loading_chain(monkeypatch):
+    loads: list[str] = []
+
+    async def get(self, chain_id, **kwargs):
+        loads.append(chain_id)
+        return None
+
+    monkeypatch.setattr(ChainRepository, "get", get)
+    client = TestClient(app)
+
+    resp = client.post(
+        "/v1/execute",
+        json={"chain_id": "c-00000000", "execution_token": "exec-t-unknown"},
+    )
+
+    assert resp.status_code == 403
+    assert resp.json()["detail"]["error"] == "token_not_found"
+    assert loads == []
@@ -0,0 +1,34 @@
+"""Governance endpoints refuse unauthenticated calls before validating the body."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gavel.gateway import app
+
+TOKEN_GUARDED = ["/v1/propose", "/v1/propose/batch", "/v1/attest", "/v1/approve"]
+
+
+@pytest.mark.parametrize("path", TOKEN_GUARDED)
+def test_missing_token_rejected_before_body_validation(path):
+    client = TestClient(app)
+
+    resp = client.post(path, json={"not": "a valid body"})
+
+    assert resp.status_code == 401
+    assert resp.json()["detail"]["error"] == "missing_token"
+
+
+@pytest.mark.parametrize("path", TOKEN_GUARDED)
+def test_unknown_token_rejected_before_body_validation(path):
+    client = TestClient(app)
+
+    resp = client.post(
+        path,
+        json={"not": "a valid body"},
+        headers={"X-Gavel-Token": "gvl_tok_unknown"},
+    )
+
+    assert resp.status_code == 403
+    assert resp.json()["detail"]["error"] == "token_invalid"
@@ -5,7 +5,10 @@ from __future__ import annotations
 import pytest
 
 from gavel.hooks import (
+    HIGH_RISK_PATTERNS,
+    HIGH_RISK_RE,
     build_risk_factors,
+    is_high_risk_command,
     classify_risk,
     extract_scope_from_tool_input,
     format_action_log,
@@ -90,6 +93,21 @@ class TestRiskClassification:
         risk = classify_risk("Bash", {"command": "rm -rf /"})
         assert risk <= 1.0
 
+    @pytest.mark.parametrize("command", [
+        "RM -RF /tmp", "git push origin main", "pip install requests",
+        "pip install -e .", "curl -x post http://x", "ls -la", "echo shutdown",
+    ])
+    def test_fused_pattern_agrees_with_pattern_list(self, command):
+        import re
+        expected = any(re.search(p, command, re.IGNORECASE) for p in HIGH_RISK_PATTERNS)
+        assert bool(HIGH_RISK_RE.search(command)) is expected
+
+    @pytest.mark.parametrize("command", [
+        "RM -RF /tmp", "Git Push", "ls -la", "echo hello", "gıt push", "pİp install x",
+    ])
+    def test_literal_prefilter_agrees_with_regex(self, command):
+        assert is_high_risk_command(command) is bool(HIGH_RISK_RE.search(command))
+
 
 class TestShouldGovern:
     def test_below_threshold(self):
@@ -149,6 +167,17 @@ class TestExtractScope:
         scope = extract_scope_from_tool_input("Bash", {"command": "curl https://api.example.com"})
         assert scope["allow_network"] is True
 
+    @pytest.mark.parametrize("command,expected", [
+        ("ls && wget -q http://x", True),
+        ("git fetch origin", True),
+        ("libcurl-config --version", False),
+        ("curly_braces.py", False),
+        ("echo prefetch", False),
+    ])
+    def test_bash_network_needs_whole_word(self, command, expected):
+        scope = extract_scope_from_tool_input("Bash", {"command": command})
+        assert scope["allow_network"] is expected
+
     def test_web_fetch(self):
         scope = extract_scope_from_tool_input("WebFetch", {"url": "https://example.com"})
         assert scope["allow_network"] is True
@@ -276,3 +276,26 @@ class TestTokenManagerCleanup:
         removed = await tm.cleanup_expired()
         assert removed == 0
         assert await tm._repo.get(tok.token) is not None
+
+
+# ── Auto-migrate output capture is bounded ─────────────────────
+
+
+class TestMigrateOutputTail:
+    async def test_read_tail_keeps_only_last_bytes(self):
+        from gavel.gateway import _read_tail
+
+        reader = asyncio.StreamReader()
+        for i in range(50):
+            reader.feed_data(bytes([65 + i % 26]) * 1000)
+        reader.feed_data(b"final error line")
+        reader.feed_eof()
+
+        tail = await _read_tail(reader, 4096)
+        assert len(tail) == 4096
+        assert tail.endswith(b"final error line")
+
+    async def test_read_tail_handles_missing_stream(self):
+        from gavel.gateway import _read_tail
+
+        assert await _read_tail(None, 10) == b""
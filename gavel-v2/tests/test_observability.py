@@ -3,15 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import os
-import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from gavel.observability import (
     DEFAULT_BUCKETS,
     MetricDefinition,
@@ -77,6 +77,40 @@ class TestPrivacyScanner:
         assert "415-555-1234" not in r.redacted_text
         assert "123-45-6789" not in r.redacted_text
 
+    def test_email_inside_punctuated_run_still_redacted(self):
+        r = scan_text("see .foo@bar.com and x.y@example.org")
+        assert r.pii_count == 2
+        assert "@" not in r.redacted_text
+
+    def test_long_dotted_run_scans_in_linear_time(self):
+        """``a.a.a.…`` used to make the email pattern quadratic."""
+        import time
+
+        start = time.perf_counter()
+        r = scan_text("a." * 100_000)
+        assert r.passed
+        assert time.perf_counter() - start < 2.0
+
+    def test_findings_are_slotted(self):
+        r = scan_text("Contact me at jane.doe@example.com")
+        assert not hasattr(r, "__dict__")
+        assert not hasattr(r.findings[0], "__dict__")
+
+    def test_redaction_matches_right_to_left_splice(self):
+        from gavel.privacy import _redact
+
+        def splice(text, replacements):
+            for start, end, tag in sorted(replacements, key=lambda r: r[0], reverse=True):
+                text = text[:start] + tag + text[end:]
+            return text
+
+        text = "0123456789abcdefghij"
+        disjoint = [(12, 15, "[B]"), (0, 2, "[A]"), (18, 20, "[C]")]
+        overlapping = [(0, 6, "[A]"), (4, 9, "[B]")]
+        assert _redact(text, disjoint) == splice(text, disjoint)
+        assert _redact(text, overlapping) == splice(text, overlapping)
+        assert _redact(text, []) == text
+
 
 class TestEvidenceReviewerIntegration:
     def _mk_packet(self) -> tuple[EvidencePacket, ScopeDeclaration]:
@@ -0,0 +1,118 @@
+"""/v1/propose/batch: refused as a whole on policy violations, otherwise reported per proposal."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from conftest import _valid_application
+from gavel.db.repositories import ChainRepository
+from gavel.gateway import app
+
+ACTOR = "agent:batch-proposer"
+
+
+def _enrolled_headers(client: TestClient) -> dict[str, str]:
+    register = client.post(
+        "/v1/agents/register",
+        json={
+            "agent_id": ACTOR,
+            "display_name": "Batch Proposer",
+            "agent_type": "llm",
+            "capabilities": ["Read"],
+        },
+    )
+    assert register.status_code == 200, register.text
+    enroll = client.post(
+        "/v1/agents/enroll",
+        json=_valid_application(ACTOR).model_dump(mode="json"),
+    )
+    assert enroll.status_code == 200, enroll.text
+    return {"X-Gavel-Token": enroll.json()["governance_token"]["token"]}
+
+
+def _proposal(command: str) -> dict:
+    return {
+        "actor_id": ACTOR,
+        "goal": f"run {command}",
+        "action_type": "bash",
+        "scope": {"allow_commands": [command]},
+        "risk_factors": {"base_risk": 0.2},
+    }
+
+
+def test_batch_starts_one_chain_per_proposal():
+    client = TestClient(app)
+    headers = _enrolled_headers(client)
+
+    resp = client.post(
+        "/v1/propose/batch",
+        json={"proposals": [_proposal("ls"), _proposal("echo hi")]},
+        headers=headers,
+    )
+
+    assert resp.status_code == 200, resp.text
+    items = resp.json()
+    assert [item["index"] for item in items] == [0, 1]
+    assert all(item["status_code"] == 200 for item in items)
+    results = [item["result"] for item in items]
+    assert results[0]["chain_id"] != results[1]["chain_id"]
+    for result in results:
+        assert set(result) == {"chain_id", "status", "risk", "tier", "sla_remaining", "timeline"}
+
+
+def test_failure_mid_batch_reported_per_item(monkeypatch):
+    client = TestClient(app)
+    headers = _enrolled_headers(client)
+
+    real_save = ChainRepository.save
+    saves = 0
+
+    async def save_failing_second_chain(self, chain):
+        nonlocal saves
+        saves += 1
+        if saves == 2:
+            raise RuntimeError("database went away")
+        await real_save(self, chain)
+
+    monkeypatch.setattr(ChainRepository, "save", save_failing_second_chain)
+
+    resp = client.post(
+        "/v1/propose/batch",
+        json={"proposals": [_proposal("ls"), _proposal("pwd"), _proposal("echo hi")]},
+        headers=headers,
+    )
+
+    assert resp.status_code == 200, resp.text
+    items = resp.json()
+    assert [item["status_code"] for item in items] == [200, 500, 200]
+    assert items[1]["result"] is None
+    assert items[1]["detail"] == "Internal error"
+
+    # Chains before and after the failure stay persisted, and their ids
+    # reach the caller.
+    started = {items[0]["result"]["chain_id"], items[2]["result"]["chain_id"]}
+    listed = {c["chain_id"] for c in client.get("/v1/chains", headers=headers).json()}
+    assert listed == started
+
+
+def test_blocked_command_refuses_whole_batch():
+    client = TestClient(app)
+    headers = _enrolled_headers(client)
+
+    resp = client.post(
+        "/v1/propose/batch",
+        json={"proposals": [_proposal("ls"), _proposal("rm -rf /")]},
+        headers=headers,
+    )
+
+    assert resp.status_code == 403
+    assert "rm -rf" in resp.json()["detail"]
+    assert client.get("/v1/chains", headers=headers).json() == []
+
+
+def test_empty_batch_rejected():
+    client = TestClient(app)
+    headers = _enrolled_headers(client)
+
+    resp = client.post("/v1/propose/batch", json={"proposals": []}, headers=headers)
+    assert resp.status_code == 422
@@ -0,0 +1,70 @@
+"""Pooled proxy clients must not carry cookies from one agent to another."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from gavel.proxy import ProxyConfig, TokenValidator, create_docker_proxy_app, create_proxy_app
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Route every pooled proxy client to a mock upstream that sets a cookie."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            headers={"Set-Cookie": f"session=of-request-{len(seen)}; Path=/"},
+            json={"ok": True},
+        )
+
+    real_client = httpx.AsyncClient
+
+    def client_with_mock_transport(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return real_client(*args, **kwargs)
+
+    async def validate(self, token):
+        return True, token, "valid"
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_with_mock_transport)
+    monkeypatch.setattr(TokenValidator, "validate", validate)
+    return seen
+
+
+def _config(tmp_path) -> ProxyConfig:
+    return ProxyConfig(ledger_path=tmp_path / "ledger.jsonl", shared_secret="")
+
+
+def test_upstream_cookie_not_replayed_for_another_agent(upstream, tmp_path):
+    with TestClient(create_proxy_app(_config(tmp_path))) as client:
+        for agent in ("agent:one", "agent:two"):
+            client.cookies.clear()  # distinct callers; only the proxy is shared
+            resp = client.post(
+                "/v1/chat/completions",
+                headers={"Host": "api.openai.com", "X-Gavel-Token": agent},
+                json={},
+            )
+            assert resp.status_code == 200, resp.text
+
+    assert len(upstream) == 2
+    assert "cookie" not in upstream[1].headers
+
+
+def test_docker_cookie_not_replayed_for_another_agent(upstream, tmp_path):
+    with TestClient(create_docker_proxy_app(_config(tmp_path))) as client:
+        for agent in ("agent:one", "agent:two"):
+            client.cookies.clear()  # distinct callers; only the proxy is shared
+            resp = client.post(
+                "/v1.43/containers/create",
+                headers={"X-Gavel-Token": agent},
+                json={},
+            )
+            assert resp.status_code == 200, resp.text
+
+    assert len(upstream) == 2
+    assert "cookie" not in upstream[1].headers
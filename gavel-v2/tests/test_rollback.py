@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 from pathlib import Path
 
 import pytest
@@ -61,6 +63,18 @@ class TestSnapshot:
         assert not big_snap.captured_full
         assert big_snap.content_b64 is None
         assert big_snap.sha256
+        assert big_snap.sha256 == hashlib.sha256(b"x" * 1024).hexdigest()
+
+    def test_large_scope_parallel_snapshot(self, workspace: Path):
+        many = workspace / "many"
+        many.mkdir()
+        for i in range(40):
+            (many / f"f{i}.txt").write_text(f"file {i}\n")
+        snap = Snapshotter()
+        manifest = snap.snapshot("chain-1", ["many"], root=workspace)
+        assert len(manifest.files) == 40
+        for path, f in manifest.files.items():
+            assert f.sha256 == hashlib.sha256((workspace / path).read_bytes()).hexdigest()
 
 
 class TestVerifyUntouched:
@@ -83,6 +97,14 @@ class TestVerifyUntouched:
         drifted = snap.verify_untouched("chain-1", root=workspace)
         assert any("app.py" in p for p in drifted)
 
+    def test_detects_same_size_modification(self, workspace: Path):
+        snap = Snapshotter()
+        snap.snapshot("chain-1", ["src"], root=workspace)
+        (workspace / "src" / "util.py").write_text("x = 2\n")
+        drifted = snap.verify_untouched("chain-1", root=workspace)
+        assert drifted == [p for p in drifted if p.endswith("util.py")]
+        assert len(drifted) == 1
+
 
 class TestRollback:
     def test_rollback_restores_modified_file(self, workspace: Path):
@@ -144,3 +166,82 @@ class TestRollback:
         snap.snapshot("chain-1", ["src"], root=workspace)
         report = snap.rollback("chain-1", reason="integrity violation", root=workspace)
         assert "integrity violation" in report.trigger_reason
+
+
+class TestHashCache:
+    def test_cached_digest_reused_until_file_changes(self, workspace: Path, monkeypatch):
+        from gavel import rollback
+
+        target = workspace / "src" / "app.py"
+        monkeypatch.setattr(rollback, "_HASH_CACHE", type(rollback._HASH_CACHE)())
+        monkeypatch.setattr(rollback, "_RACY_WINDOW_NS", 0)
+        first = rollback._hash_file(target)
+
+        calls = []
+        real_file_digest = hashlib.file_digest
+        monkeypatch.setattr(
+            rollback.hashlib,
+            "file_digest",
+            lambda f, name: calls.append(name) or real_file_digest(f, name),
+        )
+        assert rollback._hash_file(target) == first
+        assert calls == []
+
+        target.write_text("print('changed, and longer')\n")
+        assert rollback._hash_file(target) == hashlib.sha256(target.read_bytes()).hexdigest()
+        assert calls == ["sha256"]
+
+    def test_cache_is_bounded(self, workspace: Path, monkeypatch):
+        from gavel import rollback
+
+        monkeypatch.setattr(rollback, "_HASH_CACHE", type(rollback._HASH_CACHE)())
+        monkeypatch.setattr(rollback, "_HASH_CACHE_MAX", 2)
+        monkeypatch.setattr(rollback, "_RACY_WINDOW_NS", 0)
+        for name in ("app.py", "util.py"):
+            rollback._hash_file(workspace / "src" / name)
+        rollback._hash_file(workspace / "README.md")
+        assert len(rollback._HASH_CACHE) == 2
+        assert str(workspace / "src" / "app.py") not in rollback._HASH_CACHE
+
+    def test_recently_modified_file_not_cached(self, workspace: Path, monkeypatch):
+        from gavel import rollback
+
+        monkeypatch.setattr(rollback, "_HASH_CACHE", type(rollback._HASH_CACHE)())
+        target = workspace / "src" / "app.py"
+        target.write_text("print('just written')\n")
+
+        assert rollback._hash_file(target) == hashlib.sha256(target.read_bytes()).hexdigest()
+        assert str(target) not in rollback._HASH_CACHE
+
+    def test_write_during_read_not_cached(self, workspace: Path, monkeypatch):
+        from gavel import rollback
+
+        monkeypatch.setattr(rollback, "_HASH_CACHE", type(rollback._HASH_CACHE)())
+        monkeypatch.setattr(rollback, "_RACY_WINDOW_NS", 0)
+        target = workspace / "src" / "app.py"
+        real_file_digest = hashlib.file_digest
+
+        def digest_racing_a_writer(f, name):
+            target.write_text("print('written mid-hash, and longer')\n")
+            return real_file_digest(f, name)
+
+        monkeypatch.setattr(rollback.hashlib, "file_digest", digest_racing_a_writer)
+        rollback._hash_file(target)
+        assert str(target) not in rollback._HASH_CACHE
+
+    def test_verify_untouched_ignores_stale_cache(self, workspace: Path, monkeypatch):
+        from gavel import rollback
+
+        monkeypatch.setattr(rollback, "_HASH_CACHE", type(rollback._HASH_CACHE)())
+        snap = Snapshotter(max_bytes_per_file=1)
+        snap.snapshot("chain-1", ["src/app.py"], root=workspace)
+
+        target = workspace / "src" / "app.py"
+        original = target.read_bytes()
+        target.write_bytes(original.upper())  # same size, different bytes
+        # A coarse-mtime filesystem can leave the stat key unchanged.
+        with target.open("rb") as f:
+            key = rollback._stat_key(os.fstat(f.fileno()))
+        rollback._HASH_CACHE[str(target)] = (key, hashlib.sha256(original).hexdigest())
+
+        assert snap.verify_untouched("chain-1", root=workspace) == ["src/app.py"]
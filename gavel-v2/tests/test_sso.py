@@ -174,6 +174,23 @@ class TestSessionManager:
         valid = mgr.validate_session_token(session.session_token)
         assert valid is not None
 
+    def test_validate_session_token_picks_matching_session(self):
+        mgr = SessionManager()
+        sessions = [
+            mgr.create_session(OperatorIdentity(operator_id=f"op:{i}", provider_id="idp-1"))
+            for i in range(5)
+        ]
+        found = mgr.validate_session_token(sessions[3].session_token)
+        assert found is not None and found.session_id == sessions[3].session_id
+        assert mgr.validate_session_token("gvl_sess_unknown") is None
+
+    def test_validate_session_token_rejects_revoked(self):
+        mgr = SessionManager()
+        identity = OperatorIdentity(operator_id="op:alice", provider_id="idp-1")
+        session = mgr.create_session(identity)
+        mgr.revoke_session(session.session_id)
+        assert mgr.validate_session_token(session.session_token) is None
+
     def test_revoke_all_sessions(self):
         mgr = SessionManager()
         identity = OperatorIdentity(operator_id="op:alice", provider_id="idp-1")
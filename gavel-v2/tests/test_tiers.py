@@ -4,7 +4,14 @@ from __future__ import annotations
 
 import pytest
 
-from gavel.tiers import AutonomyTier, RiskFactors, TierPolicy, TierRequirements, TIER_TABLE
+from gavel.tiers import (
+    AutonomyTier,
+    RiskFactors,
+    TierPolicy,
+    TierRequirements,
+    TIER_REQUIREMENTS,
+    TIER_TABLE,
+)
 
 
 class TestTierTable:
@@ -41,6 +48,19 @@ class TestTierTable:
         semi_sla = TIER_TABLE[AutonomyTier.SEMI_AUTONOMOUS].sla_seconds
         assert supervised_sla > semi_sla  # 3600 > 600
 
+    def test_requirements_tuple_indexed_by_tier(self):
+        assert len(TIER_REQUIREMENTS) == len(AutonomyTier)
+        for tier in AutonomyTier:
+            assert TIER_REQUIREMENTS[tier] is TIER_TABLE[tier]
+            assert TIER_REQUIREMENTS[tier].tier == tier
+            assert TierPolicy().get_requirements(tier) is TIER_TABLE[tier]
+
+    def test_requirements_are_frozen(self):
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            TIER_TABLE[AutonomyTier.SUPERVISED].requires_human_approval = False
+
 
 class TestRiskScoring:
     def setup_method(self):
@@ -171,3 +191,12 @@ class TestFullEvaluation:
         })
         # 0.5 would be SEMI_AUTONOMOUS with defaults, but AUTONOMOUS with strict
         assert strict_policy.determine_tier(0.5) == AutonomyTier.AUTONOMOUS
+
+    def test_misordered_thresholds_rejected(self):
+        with pytest.raises(ValueError, match="non-decreasing"):
+            TierPolicy(risk_thresholds={
+                AutonomyTier.SUPERVISED: 0.0,
+                AutonomyTier.SEMI_AUTONOMOUS: 0.8,
+                AutonomyTier.AUTONOMOUS: 0.7,
+                AutonomyTier.CRITICAL: 0.9,
+            })
@@ -10,18 +10,11 @@ constructor boilerplate.
 
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
 
-# Ensure gavel package is importable when running pytest from the repo root.
-_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-if _REPO_ROOT not in sys.path:
-    sys.path.insert(0, _REPO_ROOT)
-
 from gavel.enrollment import (
     ActionBoundaries,
     CapabilityManifest,